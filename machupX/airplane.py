@@ -8,10 +8,10 @@ import numpy as np
 import math as m
 import scipy.integrate as integ
 
-from airfoil_db import Airfoil
+from airfoil_db import Airfoil, DatabaseBoundsError
 #from stl import mesh
 from mpl_toolkits.mplot3d import Axes3D
-from machupX.helpers import import_value,  euler_to_quat, check_filepath, quat_trans, quat_inv_trans, quat_conj, reflect_vector_3d
+from machupX.helpers import import_value,  euler_to_quat, check_filepath, quat_trans, quat_inv_trans, quat_conj, reflect_vector_3d, spatial_node_vectors
 from machupX.wing_segment import WingSegment
 
 
@@ -74,6 +74,7 @@ class Airplane:
         self.wing_segments = {}
         self._airfoil_database = {}
         self.N = 0
+        self._outline_key = None
 
         # Set up data
         self._load_params(airplane_input)
@@ -446,6 +447,9 @@ class Airplane:
         Figures out which wing segments are contiguous and sets up the lists of control points and vortex nodes
         """
 
+        # Outlines stored for plotting are no longer valid
+        self._outline_key = None
+
         # Initialize arrays
         # Geometry
         self.c_bar = np.zeros(self.N) # Average chord
@@ -716,41 +720,26 @@ class Airplane:
                 self.P0_joint_eff[i,:,:] = np.copy(self.P0_eff[i,:,:])
                 self.P1_joint_eff[i,:,:] = np.copy(self.P1_eff[i,:,:])
         
-        # Calculate vectors from control points to vortex node locations
-        self.r_0 = self.PC[:,np.newaxis,:]-self.P0_eff
-        self.r_1 = self.PC[:,np.newaxis,:]-self.P1_eff
-        self.r_0_joint = self.PC[:,np.newaxis,:]-self.P0_joint_eff
-        self.r_1_joint = self.PC[:,np.newaxis,:]-self.P1_joint_eff
-        
-        # Calculate spatial node vector magnitudes
-        self.r_0_mag = np.linalg.norm(self.r_0, axis=-1)
-        self.r_0_joint_mag = np.linalg.norm(self.r_0_joint, axis=-1)
-        self.r_1_mag = np.linalg.norm(self.r_1, axis=-1)
-        self.r_1_joint_mag = np.linalg.norm(self.r_1_joint, axis=-1)
-        
-        # Calculate magnitude products
-        self.r_0_r_0_joint_mag = self.r_0_mag*self.r_0_joint_mag
-        self.r_0_r_1_mag = self.r_0_mag*self.r_1_mag
-        self.r_1_r_1_joint_mag = self.r_1_mag*self.r_1_joint_mag
+        # Calculate vectors from control points to vortex node locations, their magnitudes, and magnitude products
+        self.r_0, self.r_1, self.r_0_joint, self.r_1_joint = np.empty((4,self.N,self.N,3))
+        self.r_0_mag, self.r_1_mag, self.r_0_joint_mag, self.r_1_joint_mag = np.empty((4,self.N,self.N))
+        self.r_0_r_0_joint_mag, self.r_0_r_1_mag, self.r_1_r_1_joint_mag = np.empty((3,self.N,self.N))
+        spatial_node_vectors(self.PC,
+                             (self.P0_eff, self.P1_eff, self.P0_joint_eff, self.P1_joint_eff),
+                             (self.r_0, self.r_1, self.r_0_joint, self.r_1_joint),
+                             (self.r_0_mag, self.r_1_mag, self.r_0_joint_mag, self.r_1_joint_mag),
+                             (self.r_0_r_0_joint_mag, self.r_0_r_1_mag, self.r_1_r_1_joint_mag))
         
         # Image calcs
         if self.has_FS:
-            # Image vectors
-            self.r_0_image = self.PC[:,np.newaxis,:]-self.P0_eff_image
-            self.r_1_image = self.PC[:,np.newaxis,:]-self.P1_eff_image 
-            self.r_0_joint_image = self.PC[:,np.newaxis,:]-self.P0_joint_eff_image
-            self.r_1_joint_image = self.PC[:,np.newaxis,:]-self.P1_joint_eff_image
-                    
-            # Image vector mags
-            self.r_0_mag_image = np.linalg.norm(self.r_0_image, axis=-1)
-            self.r_0_joint_mag_image = np.linalg.norm(self.r_0_joint_image, axis=-1)
-            self.r_1_mag_image = np.linalg.norm(self.r_1_image, axis=-1)
-            self.r_1_joint_mag_image = np.linalg.norm(self.r_1_joint_image, axis=-1)
-            
-            # Calculate image magnitude products
-            self.r_0_r_0_joint_mag_image = self.r_0_mag_image*self.r_0_joint_mag_image
-            self.r_0_r_1_mag_image = self.r_0_mag_image*self.r_1_mag_image
-            self.r_1_r_1_joint_mag_image = self.r_1_mag_image*self.r_1_joint_mag_image      
+            self.r_0_image, self.r_1_image, self.r_0_joint_image, self.r_1_joint_image = np.empty((4,self.N,self.N,3))
+            self.r_0_mag_image, self.r_1_mag_image, self.r_0_joint_mag_image, self.r_1_joint_mag_image = np.empty((4,self.N,self.N))
+            self.r_0_r_0_joint_mag_image, self.r_0_r_1_mag_image, self.r_1_r_1_joint_mag_image = np.empty((3,self.N,self.N))
+            spatial_node_vectors(self.PC,
+                                 (self.P0_eff_image, self.P1_eff_image, self.P0_joint_eff_image, self.P1_joint_eff_image),
+                                 (self.r_0_image, self.r_1_image, self.r_0_joint_image, self.r_1_joint_image),
+                                 (self.r_0_mag_image, self.r_1_mag_image, self.r_0_joint_mag_image, self.r_1_joint_mag_image),
+                                 (self.r_0_r_0_joint_mag_image, self.r_0_r_1_mag_image, self.r_1_r_1_joint_mag_image))
         
         # Calculate differential length vectors
         self.dl = self.P1-self.P0
@@ -907,6 +896,34 @@ class Airplane:
             for segment in wing:
                 self.segments.append(segment)
 
+        # Group segments by airfoil
+        self._group_segments_by_airfoil()
+
+
+    def _group_segments_by_airfoil(self):
+        # Groups the control points of all segments having a single airfoil by which airfoil they use, so that
+        # each airfoil can be evaluated for all of its control points at once. Segments with a distribution of
+        # airfoils are stored separately and evaluated one at a time.
+        airfoil_groups = {}
+        self._multi_airfoil_segments = []
+        index = 0
+        for segment in self.segments:
+            seg_slice = slice(index, index+segment.N)
+            if segment._num_airfoils == 1:
+                airfoil = segment._airfoils[0]
+                airfoil_groups.setdefault(id(airfoil), (airfoil, [], []))
+                airfoil_groups[id(airfoil)][1].append(segment)
+                airfoil_groups[id(airfoil)][2].append(seg_slice)
+            else:
+                self._multi_airfoil_segments.append((segment, seg_slice))
+            index += segment.N
+
+        # Store the indices of the control points belonging to each airfoil
+        self._airfoil_groups = []
+        for airfoil, segments, slices in airfoil_groups.values():
+            cp_ind = np.concatenate([np.arange(seg_slice.start, seg_slice.stop) for seg_slice in slices])
+            self._airfoil_groups.append((airfoil, segments, slices, cp_ind))
+
 
     def _check_reference_params(self):
         # If the reference area and lengths have not been set, this takes care of that.
@@ -983,6 +1000,59 @@ class Airplane:
             wing_segment.apply_control(control_state, self._control_symmetry)
 
 
+    def get_cp_coefs(self, alpha, Rey, Mach, coef_funcs):
+        """Returns section coefficients at each control point on the airplane. Each airfoil
+        is evaluated once for all control points using it, rather than once per wing segment.
+
+        Parameters
+        ----------
+        alpha : ndarray
+            Angle of attack at each control point
+
+        Rey : ndarray
+            Reynolds number at each control point
+
+        Mach : ndarray
+            Mach number at each control point
+
+        coef_funcs : list of str
+            Names of the airfoil methods to evaluate, e.g. "get_CL".
+
+        Returns
+        -------
+        list of ndarray
+            The coefficients at each control point, in the same order as coef_funcs.
+        """
+
+        coefs = [np.empty(self.N) for _ in coef_funcs]
+
+        # Segments with a single airfoil
+        for airfoil, segments, slices, cp_ind in self._airfoil_groups:
+            delta_flap = np.concatenate([segment._delta_flap for segment in segments])
+            c_f = np.concatenate([segment._cp_c_f for segment in segments])
+            try:
+                for coef, coef_func in zip(coefs, coef_funcs):
+                    coef[cp_ind] = getattr(airfoil, coef_func)(alpha=alpha[cp_ind],
+                                                               Rey=Rey[cp_ind],
+                                                               Mach=Mach[cp_ind],
+                                                               trailing_flap_deflection=delta_flap,
+                                                               trailing_flap_fraction=c_f)
+
+            except DatabaseBoundsError:
+                # Evaluate segment by segment so the error is reported for the segment on which it occurred
+                for segment, seg_slice in zip(segments, slices):
+                    for coef_func in coef_funcs:
+                        segment._get_control_point_coef(alpha[seg_slice], Rey[seg_slice], Mach[seg_slice], coef_func)
+                raise
+
+        # Segments with a distribution of airfoils
+        for segment, seg_slice in self._multi_airfoil_segments:
+            for coef, coef_func in zip(coefs, coef_funcs):
+                coef[seg_slice] = segment._get_control_point_coef(alpha[seg_slice], Rey[seg_slice], Mach[seg_slice], coef_func)
+
+        return coefs
+
+
     def get_MAC(self):
         """Returns the mean aerodynamic chord (MAC).
 
@@ -1027,6 +1097,40 @@ class Airplane:
         return results
 
 
+    def get_outline_points(self):
+        """Returns the planar outline of each wing segment in Earth-fixed coordinates.
+        The transformed outlines are reused until the position or orientation of the
+        aircraft changes.
+
+        Returns
+        -------
+        dict
+            Outline points and control surface outline points (None if the segment has
+            no control surface) of each wing segment, keyed by segment name.
+        """
+
+        # Transform the outlines again only if the aircraft has moved
+        outline_key = (self.p_bar.tobytes(), self.q.tobytes())
+        if outline_key != self._outline_key:
+
+            # Transform the outlines of all segments together
+            outlines = [segment_object.get_outline_points() for segment_object in self.wing_segments.values()]
+            body_points = [points for outline in outlines for points in outline if points is not None]
+            split_indices = np.cumsum([len(points) for points in body_points[:-1]])
+            earth_points = iter(np.split(self.p_bar+quat_inv_trans(self.q, np.concatenate(body_points)), split_indices))
+
+            # Sort back out by segment
+            self._outline_points = {}
+            for segment_name, (_, cntrl_points) in zip(self.wing_segments.keys(), outlines):
+                points = next(earth_points)
+                if cntrl_points is not None:
+                    cntrl_points = next(earth_points)
+                self._outline_points[segment_name] = (points, cntrl_points)
+            self._outline_key = outline_key
+
+        return self._outline_points
+
+
     def export_stl(self, **kwargs):
         """Exports a .stl model of the aircraft.
 
@@ -151,7 +151,7 @@ vectorized_convert_units = np.vectorize(convert_units)
 def quat_trans(q, v):
     # Transforms the vector v from the global frame to a frame having an orientation described by q.
     v_T = np.transpose(v)
-    T = np.zeros((4,*v_T.shape[1:]))
+    T = np.zeros((4,*v_T.shape[1:]), dtype=np.result_type(v_T, np.float32))
     v_trans = np.zeros_like(v_T)
 
     T[0] = -v_T[0]*q[1] - v_T[1]*q[2] - v_T[2]*q[3]
@@ -169,7 +169,7 @@ def quat_trans(q, v):
 def quat_inv_trans(q, v):
     # Transforms the vector v from a frame having an orientation described by q to the global frame.
     v_T = np.transpose(v)
-    T = np.zeros((4,*v_T.shape[1:]))
+    T = np.zeros((4,*v_T.shape[1:]), dtype=np.result_type(v_T, np.float32))
     v_trans = np.zeros_like(v_T)
 
     T[0] =  v_T[0]*q[1] + v_T[1]*q[2] + v_T[2]*q[3]
@@ -262,6 +262,29 @@ def quat_conj(q):
     return [q[0], -q[1], -q[2], -q[3]]
 
 
+def quat_to_matrix(q):
+    # Returns the rotation matrix R such that R.dot(v) is equivalent to quat_trans(q, v). Rotating many vectors
+    # by the same quaternion is cheaper with this matrix.
+    e0, ex, ey, ez = q
+    return np.array([[e0*e0+ex*ex-ey*ey-ez*ez, 2.0*(ex*ey+e0*ez), 2.0*(ex*ez-e0*ey)],
+                     [2.0*(ex*ey-e0*ez), e0*e0-ex*ex+ey*ey-ez*ez, 2.0*(ey*ez+e0*ex)],
+                     [2.0*(ex*ez+e0*ey), 2.0*(ey*ez-e0*ex), e0*e0-ex*ex-ey*ey+ez*ez]])
+
+
+def deep_copy_input(input_obj):
+    # Copies a nested input structure of dicts and lists. Arrays are copied with ndarray.copy(), which is much faster
+    # than copy.deepcopy() for input containing large atmospheric fields. All other leaves are immutable in JSON-style
+    # input and are shared.
+    if isinstance(input_obj, dict):
+        return {key : deep_copy_input(value) for key, value in input_obj.items()}
+    elif isinstance(input_obj, list):
+        return [deep_copy_input(value) for value in input_obj]
+    elif isinstance(input_obj, np.ndarray):
+        return input_obj.copy()
+    else:
+        return input_obj
+
+
 def parse_input(mux_input):
     """Takes an input to MachUpX and converts it to a scene dictionary and lists of airplanes, states, and control states.
     This is really just used to simplify things in the unit tests.
@@ -295,7 +318,7 @@ def parse_input(mux_input):
             scene_dict = json.load(input_handle)
 
     else:
-        scene_dict = copy.deepcopy(mux_input)
+        scene_dict = deep_copy_input(mux_input)
 
     # Get aircraft
     airplane_names = []
@@ -318,26 +341,20 @@ def parse_input(mux_input):
         return scene_dict, airplane_names, airplanes, states, control_states
         
         
-def reflect_vector_3d(vectors, plane_normal, point_on_plane, axis=0):
+def reflect_vector_3d(vectors, plane_normal, point_on_plane, axis=0, out=None):
     """
     Reflects 3D vectors about an arbitrary plane defined by a point-and-normal. Returns the reflected vectors.
     
     Argument "axis" specifies the direction along which vectors are stacked if "vectors" is an array.
+
+    For arrays of vectors, "out" may be given as an array (or view) of the same shape, not overlapping
+    "vectors", into which the reflected vectors are written.
     """    
     
     vectors = np.asarray(vectors)
     plane_normal = np.asarray(plane_normal)
     point_on_plane = np.asarray(point_on_plane)
     
-    first_dim = 0
-    is_3D = False
-    if len(vectors.shape) > 2:
-        first_dim = vectors.shape[0]
-        is_3D = True
-        
-    # Initialize an array to store the reflected vectors
-    reflected_vectors = np.zeros_like(vectors)
-    
     # Reflect vectors. Check number of dimensions first
     if vectors.ndim == 1:
         
@@ -345,43 +362,109 @@ def reflect_vector_3d(vectors, plane_normal, point_on_plane, axis=0):
         projection = vectors - np.dot(vectors - point_on_plane, plane_normal)*plane_normal
         
         # Calculate the reflected vector
-        reflected_vectors = 2 * projection - vectors
+        return 2 * projection - vectors
         
-    # Reflect 2D array of vectors
+    # Reflect 2D or 3D array of vectors
+    # Stacking along axis 1 means the vector components lie along the second-to-last axis
+    if axis == 0:
+        comp_axis = -1
+    elif axis == 1:
+        comp_axis = -2
     else:
-            
-        for i in range(max(first_dim,1)):
-            
-            if is_3D:
-                this_array = vectors[i,:,:]
-            else:
-                this_array = vectors
-                
-            if axis == 0:
-                iter_axis = this_array.shape[0]
-            elif axis == 1:
-                iter_axis = this_array.shape[1]
-            else:
-                raise IOError(f"Cannot iterate along axis {axis}. Use 0 for rows or 1 for columns.")
-                
-            for j in range(iter_axis):
-            
-                if axis == 0:
-                    vector = this_array[j,:]
-                elif axis == 1:
-                    vector = this_array[:,j]
-                                        
-                # Calculate the projection of the vector onto the plane
-                projection = vector - np.dot(vector - point_on_plane, plane_normal)*plane_normal
-                
-                # Calculate the reflected vector
-                if axis == 0 and not is_3D:
-                    reflected_vectors[j,:] = 2 * projection - vector
-                elif axis == 1 and not is_3D:
-                    reflected_vectors[:,j] = 2 * projection - vector
-                elif axis == 0 and is_3D:
-                    reflected_vectors[i,j,:] = 2 * projection - vector
-                elif axis == 1 and is_3D:
-                    reflected_vectors[i,:,j] = 2 * projection - vector              
-
-    return reflected_vectors
\ No newline at end of file
+        raise IOError(f"Cannot iterate along axis {axis}. Use 0 for rows or 1 for columns.")
+
+    # Initialize an array to store the reflected vectors
+    if out is None:
+        out = np.zeros_like(vectors)
+
+    # Signed distance of each vector from the plane, then subtract twice the normal component of each
+    v = np.moveaxis(vectors, comp_axis, -1)
+    reflected = np.moveaxis(out, comp_axis, -1)
+    dist = np.dot(v - point_on_plane, plane_normal)
+    np.multiply(dist[...,np.newaxis], 2.0*plane_normal, out=reflected)
+    np.subtract(v, reflected, out=reflected)
+
+    return out
+
+
+def cross_3d(a, b, out=None):
+    # Calculates the cross product of the 3-vectors along the last axis of a and b, broadcasting the leading axes.
+    # Writing each component directly avoids the temporaries np.cross creates for large stacks of vectors. The
+    # result is written into out, if given.
+    a = np.asarray(a)
+    b = np.asarray(b)
+    if out is None:
+        out = np.empty(np.broadcast(a, b).shape, dtype=np.result_type(a, b))
+    np.subtract(a[...,1]*b[...,2], a[...,2]*b[...,1], out=out[...,0])
+    np.subtract(a[...,2]*b[...,0], a[...,0]*b[...,2], out=out[...,1])
+    np.subtract(a[...,0]*b[...,1], a[...,1]*b[...,0], out=out[...,2])
+    return out
+
+
+def normalize_3d(v):
+    # Normalizes the 3-vectors along the last axis of v. This is faster than dividing by np.linalg.norm for short vectors.
+    return v/np.sqrt(np.einsum('...i,...i->...', v, v))[...,np.newaxis]
+
+
+def spatial_node_vectors(PC, nodes, r, r_mag, r_mag_prod):
+    # Calculates the spatial node vectors from the control points PC (shape (N,3)) to the nodes P0, P1, P0_joint,
+    # and P1_joint (each shape (N,M,3), or (M,3) if the same for every control point), passed together as "nodes". The vectors (r_0, r_1, r_0_joint, r_1_joint),
+    # their magnitudes, and the magnitude products (r_0*r_0_joint, r_0*r_1, r_1*r_1_joint) are written in place
+    # into the arrays (or views) passed as "r", "r_mag", and "r_mag_prod", so no temporaries are needed.
+    PC = PC[:,np.newaxis,:]
+    for P, r_i, r_mag_i in zip(nodes, r, r_mag):
+        np.subtract(PC, P, out=r_i)
+        np.einsum('ijk,ijk->ij', r_i, r_i, out=r_mag_i)
+        np.sqrt(r_mag_i, out=r_mag_i)
+
+    np.multiply(r_mag[0], r_mag[2], out=r_mag_prod[0])
+    np.multiply(r_mag[0], r_mag[1], out=r_mag_prod[1])
+    np.multiply(r_mag[1], r_mag[3], out=r_mag_prod[2])
+
+
+def vortex_segment_influence(r_a, r_b, r_a_mag, r_b_mag, r_a_r_b_mag, V=None):
+    # Calculates the velocity induced per unit circulation by straight vortex segments, given the vectors r_a and r_b
+    # (shape (N,M,3)) from the segment endpoints to the points of interest, their magnitudes, and the products of their
+    # magnitudes. The x, y, and z components are worked on as separate (N,M) planes, which vectorizes much better than
+    # operating along the short trailing axis with np.cross and einsum. If V is given, the influence is added to it in
+    # place, so the influences of several segments can be summed without allocating an array for each.
+    x_a, y_a, z_a = np.moveaxis(r_a, -1, 0)
+    x_b, y_b, z_b = np.moveaxis(r_b, -1, 0)
+
+    # Common factor (|r_a|+|r_b|)/(|r_a||r_b|(|r_a||r_b|+r_a.r_b))
+    factor = (r_a_mag+r_b_mag)/(r_a_r_b_mag*(r_a_r_b_mag+(x_a*x_b+y_a*y_b+z_a*z_b)))
+
+    # Multiply by r_a x r_b
+    if V is None:
+        V = np.empty(r_a.shape, dtype=r_a.dtype)
+        np.multiply(y_a*z_b-z_a*y_b, factor, out=V[...,0])
+        np.multiply(z_a*x_b-x_a*z_b, factor, out=V[...,1])
+        np.multiply(x_a*y_b-y_a*x_b, factor, out=V[...,2])
+    else:
+        V[...,0] += (y_a*z_b-z_a*y_b)*factor
+        V[...,1] += (z_a*x_b-x_a*z_b)*factor
+        V[...,2] += (x_a*y_b-y_a*x_b)*factor
+
+    return V
+
+
+def bound_and_jointed_vortex_influence(r, r_mag, r_mag_prod):
+    # Calculates the velocity induced per unit circulation by the bound and jointed segments of each horseshoe vortex
+    # at each control point. "r", "r_mag", and "r_mag_prod" are the spatial node vectors, magnitudes, and magnitude
+    # products, ordered as in spatial_node_vectors. The influence of each bound segment on its own control point is
+    # set to zero.
+    r_0, r_1, r_0_joint, r_1_joint = r
+    r_0_mag, r_1_mag, r_0_joint_mag, r_1_joint_mag = r_mag
+    r_0_r_0_joint_mag, r_0_r_1_mag, r_1_r_1_joint_mag = r_mag_prod
+
+    # Bound
+    V = vortex_segment_influence(r_0, r_1, r_0_mag, r_1_mag, r_0_r_1_mag)
+    V[np.diag_indices(V.shape[0])] = 0.0 # Ensure this actually comes out to be zero
+
+    # Jointed inbound trailing vortex (subscript 0)
+    vortex_segment_influence(r_0_joint, r_0, r_0_joint_mag, r_0_mag, r_0_r_0_joint_mag, V=V)
+
+    # Jointed outbound trailing vortex (subscript 1)
+    vortex_segment_influence(r_1, r_1_joint, r_1_mag, r_1_joint_mag, r_1_r_1_joint_mag, V=V)
+
+    return V
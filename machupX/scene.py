@@ -6,19 +6,35 @@ import warnings
 import numpy as np
 import math as m
 import scipy.interpolate as sinterp
+import scipy.linalg as slinalg
 import scipy.optimize as sopt
+import scipy.spatial as sspatial
 import scipy.special as sp
 import matplotlib.pyplot as plt
 
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 from airfoil_db import DatabaseBoundsError
 
-from machupX.helpers import quat_inv_trans, quat_trans, check_filepath, import_value, quat_mult, quat_conj, quat_to_euler, euler_to_quat, reflect_vector_3d
+from machupX.helpers import quat_inv_trans, quat_trans, check_filepath, import_value, quat_mult, quat_conj, quat_to_euler, euler_to_quat, quat_to_matrix, reflect_vector_3d, spatial_node_vectors, bound_and_jointed_vortex_influence, deep_copy_input, cross_3d, normalize_3d
 from machupX.airplane import Airplane
 from machupX.standard_atmosphere import StandardAtmosphere
 from machupX.exceptions import SolverNotConvergedError, MaxIterationError
 
 
+# Keys under which the force and moment components (or their coefficients) in each frame are reported
+_COEF_KEYS = {
+    "body" : ("Cx", "Cy", "Cz", "Cl", "Cm", "Cn"),
+    "stab" : ("Cx_s", "Cy_s", "Cz_s", "Cl_s", "Cm_s", "Cn_s"),
+    "wind" : ("CD", "CS", "CL", "Cl_w", "Cm_w", "Cn_w")
+}
+_FM_KEYS = {
+    "body" : ("Fx", "Fy", "Fz", "Mx", "My", "Mz"),
+    "stab" : ("Fx_s", "Fy_s", "Fz_s", "Mx_s", "My_s", "Mz_s"),
+    "wind" : ("FD", "FS", "FL", "Mx_w", "My_w", "Mz_w")
+}
+
+
 class Scene:
     """A class defining a scene containing one or more aircraft.
 
@@ -65,7 +81,7 @@ class Scene:
 
         # Dictionary
         elif isinstance(scene_input, dict):
-            self._input_dict = copy.deepcopy(scene_input)
+            self._input_dict = deep_copy_input(scene_input)
 
         # Input format not recognized
         else:
@@ -85,6 +101,12 @@ class Scene:
         self._match_machup_pro = solver_params.get("match_machup_pro", False)
         self._impingement_threshold = solver_params.get("impingement_threshold", 1e-10)
         self._constrain_vortex_sheet = solver_params.get("constrain_vortex_sheet", False)
+
+        # Whether the forces are integrated using the total velocity at each control point, rather than the freestream
+        self._integrate_with_v_i = self._use_total_velocity or self._match_machup_pro
+
+        # Precision of the (N,N) geometry tables
+        self._dtype = np.float32 if solver_params.get("single_precision", False) else np.float64
         
         # Store unit system. Defaults to SI units.
         self._unit_sys = self._input_dict.get("units", "SI")
@@ -93,6 +115,7 @@ class Scene:
         scene_dict = self._input_dict.get("scene", {})
         atmos_dict = scene_dict.get("atmosphere", {})
         self._std_atmos = StandardAtmosphere(unit_sys=self._unit_sys)
+        self._field_triangulation = None # Shared by atmospheric fields given at the same scattered points
         self._get_density = self._initialize_density_getter(**atmos_dict)
         self._get_wind = self._initialize_wind_getter(**atmos_dict)
         self._get_viscosity = self._initialize_viscosity_getter(**atmos_dict)
@@ -101,8 +124,8 @@ class Scene:
         # Boolean to tell whether image and wave vortices should be accounted for in the calculation of induced velocities. Should be used when simulating hydrofoil or ground effect.
         surface_dict = scene_dict.get("surface_effect_conditions", {})
         self.has_FS = surface_dict.get("has_free_surface", False)
-        self.FS_plane_normal = surface_dict.get("surf_plane_normal", [0,0,1]) # unit vector normal to free surface, defaults to unit z - [0,0,1].
-        self.FS_height = surface_dict.get("point_on_surface", [0,0,0]) # location of the free surface level. Defaults to body-fixed origin.
+        self.FS_plane_normal = np.asarray(surface_dict.get("surf_plane_normal", [0,0,1]), dtype=float) # unit vector normal to free surface, defaults to unit z - [0,0,1].
+        self.FS_height = np.asarray(surface_dict.get("point_on_surface", [0,0,0]), dtype=float) # location of the free surface level. Defaults to body-fixed origin.
         self.FS_biplane_boundary = surface_dict.get("biplane_BC", False) # true if wishing to use biplane approximation. Else FS is approximated as a rigid wall.
         self.submergence = surface_dict.get("submergence", 0) # dimensional submergence depth for calculating wavemaking influence. Defaults to 0.
         self.use_wave_corrections = surface_dict.get("wave_corrections", False) # whether or not to include the induced velocity due to the wave part of the hydrofoil potential. Defaults to false. Currently only dowssournwash (z-component) is computed.
@@ -138,8 +161,7 @@ class Scene:
                 raise IOError("{0} is not an allowable profile name.".format(rho))
 
             def density_getter(position):
-                pos = position.T
-                return self._std_atmos.rho(-pos[2])
+                return self._std_atmos.rho(-position[...,2])
             
         # Array
         elif isinstance(rho, np.ndarray):
@@ -149,14 +171,13 @@ class Scene:
             if self._density_data.shape[1] == 2: # Density profile
 
                 def density_getter(position):
-                    pos = position.T
-                    return np.interp(-pos[2], self._density_data[:,0], self._density_data[:,1])
+                    return np.interp(-position[...,2], self._density_data[:,0], self._density_data[:,1])
 
             elif self._density_data.shape[1] == 4: # Density field
-                self._density_field_interpolator = sinterp.LinearNDInterpolator(self._density_data[:,:3],self._density_data[:,3])
+                self._density_field_interpolator = self._initialize_field_interpolator(self._density_data[:,:3], self._density_data[:,3], np.nan)
 
                 def density_getter(position):
-                    return self._density_field_interpolator(position)
+                    return self._density_field_interpolator(np.atleast_2d(position))
 
         # Improper specification
         else:
@@ -178,39 +199,48 @@ class Scene:
                 self._constant_wind = V_wind
 
                 def wind_getter(position):
-                    return self._constant_wind*np.ones(position.shape)
+                    return np.broadcast_to(self._constant_wind, position.shape)
 
             else: # Array
                 self._wind_data = V_wind
                 
                 # Create getters
                 if self._wind_data.shape[1] == 6: # Wind field
-                    self._wind_field_x_interpolator = sinterp.LinearNDInterpolator(self._wind_data[:,:3], self._wind_data[:,3], fill_value=0.0)
-                    self._wind_field_y_interpolator = sinterp.LinearNDInterpolator(self._wind_data[:,:3], self._wind_data[:,4], fill_value=0.0)
-                    self._wind_field_z_interpolator = sinterp.LinearNDInterpolator(self._wind_data[:,:3], self._wind_data[:,5], fill_value=0.0)
+                    # All three components share one interpolator
+                    self._wind_field_interpolator = self._initialize_field_interpolator(self._wind_data[:,:3], self._wind_data[:,3:], 0.0)
 
                     def wind_getter(position):
                         single = len(position.shape)==1
-                        Vx = self._wind_field_x_interpolator(position)
-                        Vy = self._wind_field_y_interpolator(position)
-                        Vz = self._wind_field_z_interpolator(position)
+                        V = self._wind_field_interpolator(np.atleast_2d(position))
                         if single:
-                            return np.array([Vx.item(), Vy.item(), Vz.item()])
+                            return V[0]
                         else:
-                            return np.array([Vx, Vy, Vz]).T
+                            return V
+
+                elif self._wind_data.shape[1] == 4 and self._wind_data.shape[0] < 2: # Wind profile with a single point
+                    self._constant_wind = self._wind_data[0,1:].astype(float)
+
+                    def wind_getter(position):
+                        return np.broadcast_to(self._constant_wind, position.shape)
 
                 elif self._wind_data.shape[1] == 4: # wind profile
 
+                    # Store slopes between profile points so all three components are interpolated after a single search.
+                    # Repeated altitudes (steps in the profile) are given zero slope; these intervals are never selected.
+                    self._wind_profile_alt = self._wind_data[:,0]
+                    self._wind_profile_V = self._wind_data[:,1:]
+                    dV = np.diff(self._wind_profile_V, axis=0)
+                    dz = np.diff(self._wind_profile_alt)[:,np.newaxis]
+                    self._wind_profile_slopes = np.divide(dV, dz, out=np.zeros(dV.shape), where=dz>0)
+
                     def wind_getter(position):
-                        single = len(position.shape)==1
-                        pos_T = position.T
-                        Vx =  np.interp(-pos_T[2], self._wind_data[:,0], self._wind_data[:,1])
-                        Vy =  np.interp(-pos_T[2], self._wind_data[:,0], self._wind_data[:,2])
-                        Vz =  np.interp(-pos_T[2], self._wind_data[:,0], self._wind_data[:,3])
-                        if single:
-                            return np.array([Vx.item(), Vy.item(), Vz.item()])
-                        else:
-                            return np.array([Vx, Vy, Vz]).T
+                        alt = -position[...,2]
+                        i = np.clip(np.searchsorted(self._wind_profile_alt, alt, side='right')-1, 0, len(self._wind_profile_alt)-2)
+                        V = self._wind_profile_slopes[i]*(alt-self._wind_profile_alt[i])[...,np.newaxis]+self._wind_profile_V[i]
+
+                        # Hold the end values outside the profile
+                        V = np.where((alt < self._wind_profile_alt[0])[...,np.newaxis], self._wind_profile_V[0], V)
+                        return np.where((alt >= self._wind_profile_alt[-1])[...,np.newaxis], self._wind_profile_V[-1], V)
 
                 else:
                     raise IOError("Wind array has the wrong number of columns.")
@@ -221,6 +251,30 @@ class Scene:
         return wind_getter
 
 
+    def _initialize_field_interpolator(self, points, values, fill_value):
+        # Creates a linear interpolator for atmospheric field data. If the points make up a complete
+        # rectilinear grid, trilinear interpolation on that grid is used, which locates a query point
+        # by a search along each axis rather than a walk through a Delaunay triangulation. Otherwise,
+        # the data is treated as scattered.
+
+        # Check for a complete grid with each point appearing once
+        axes = [np.unique(points[:,i]) for i in range(points.shape[1])]
+        shape = tuple(len(axis) for axis in axes)
+        if min(shape) > 1 and np.prod(shape) == points.shape[0]:
+            grid_ind = tuple(np.searchsorted(axis, points[:,i]) for i, axis in enumerate(axes))
+            if len(np.unique(np.ravel_multi_index(grid_ind, shape))) == points.shape[0]:
+
+                # Arrange values on the grid
+                grid_values = np.zeros(shape+values.shape[1:])
+                grid_values[grid_ind] = values
+                return sinterp.RegularGridInterpolator(axes, grid_values, bounds_error=False, fill_value=fill_value)
+
+        # Scattered data. Fields given at the same points reuse the triangulation.
+        if self._field_triangulation is None or not np.array_equal(self._field_triangulation.points, points):
+            self._field_triangulation = sspatial.Delaunay(points)
+        return sinterp.LinearNDInterpolator(self._field_triangulation, values, fill_value=fill_value)
+
+
     def _initialize_viscosity_getter(self, **kwargs):
 
         # Load value from dictionary
@@ -231,7 +285,7 @@ class Scene:
         if isinstance(nu, float):
             self._constant_nu = nu
             def viscosity_getter(position):
-                return self._constant_nu*np.ones((position.shape[:-1]))
+                return np.broadcast_to(self._constant_nu, position.shape[:-1])
 
         # Atmospheric profile name
         elif isinstance(nu, str):
@@ -241,8 +295,7 @@ class Scene:
                 raise IOError("{0} is not an allowable profile name.".format(nu))
 
             def viscosity_getter(position):
-                pos = np.transpose(position)
-                return self._std_atmos.nu(-pos[2])
+                return self._std_atmos.nu(-position[...,2])
 
         return viscosity_getter
 
@@ -257,7 +310,7 @@ class Scene:
         if isinstance(a, float):
             self._constant_a = a
             def sos_getter(position):
-                return self._constant_a*np.ones((position.shape[:-1]))
+                return np.broadcast_to(self._constant_a, position.shape[:-1])
 
         # Atmospheric profile name
         elif isinstance(a, str):
@@ -267,8 +320,7 @@ class Scene:
                 raise IOError("{0} is not an allowable profile name.".format(a))
 
             def sos_getter(position):
-                pos = np.transpose(position)
-                return self._std_atmos.a(-pos[2])
+                return self._std_atmos.a(-position[...,2])
 
         return sos_getter
 
@@ -347,31 +399,38 @@ class Scene:
         self._dl = np.zeros((self._N,3)) # Differential LAC elements
         self._section_sweep = np.zeros(self._N)
 
-        # Node locations
-        self._P0 = np.zeros((self._N,self._N,3)) # Inbound vortex node location; takes into account effective LAC where appropriate
-        self._P0_joint = np.zeros((self._N,self._N,3)) # Inbound vortex joint node location
-        self._P1 = np.zeros((self._N,self._N,3)) # Outbound vortex node location
-        self._P1_joint = np.zeros((self._N,self._N,3)) # Outbound vortex joint node location
+        # Node locations, as seen by the other aircraft (i.e. without the effective LAC)
+        # These are only needed between aircraft; within each aircraft, the spatial node vectors come directly from the airplane object.
+        if self._num_aircraft > 1:
+            self._P0 = np.zeros((self._N,3)) # Inbound vortex node location
+            self._P0_joint = np.zeros((self._N,3)) # Inbound vortex joint node location
+            self._P1 = np.zeros((self._N,3)) # Outbound vortex node location
+            self._P1_joint = np.zeros((self._N,3)) # Outbound vortex joint node location
         
         # Spatial node vectors and magnitudes
-        self._r_0 = np.zeros((self._N,self._N,3))
-        self._r_1 = np.zeros((self._N,self._N,3))
-        self._r_0_joint = np.zeros((self._N,self._N,3))
-        self._r_1_joint = np.zeros((self._N,self._N,3))
-        self._r_0_mag = np.zeros((self._N,self._N))
-        self._r_0_joint_mag = np.zeros((self._N,self._N))
-        self._r_1_mag = np.zeros((self._N,self._N))
-        self._r_1_joint_mag = np.zeros((self._N,self._N))
-        
-        # Spatial node vector magnitude products
-        self._r_0_r_0_joint_mag = np.zeros((self._N,self._N))
-        self._r_0_r_1_mag = np.zeros((self._N,self._N))
-        self._r_1_r_1_joint_mag = np.zeros((self._N,self._N))
+        # For a single aircraft, these are taken directly from the airplane object in _perform_geometry_and_atmos_calcs().
+        if self._num_aircraft > 1:
+            self._r_0 = np.zeros((self._N,self._N,3), dtype=self._dtype)
+            self._r_1 = np.zeros((self._N,self._N,3), dtype=self._dtype)
+            self._r_0_joint = np.zeros((self._N,self._N,3), dtype=self._dtype)
+            self._r_1_joint = np.zeros((self._N,self._N,3), dtype=self._dtype)
+            self._r_0_mag = np.zeros((self._N,self._N), dtype=self._dtype)
+            self._r_0_joint_mag = np.zeros((self._N,self._N), dtype=self._dtype)
+            self._r_1_mag = np.zeros((self._N,self._N), dtype=self._dtype)
+            self._r_1_joint_mag = np.zeros((self._N,self._N), dtype=self._dtype)
+
+            # Spatial node vector magnitude products
+            self._r_0_r_0_joint_mag = np.zeros((self._N,self._N), dtype=self._dtype)
+            self._r_0_r_1_mag = np.zeros((self._N,self._N), dtype=self._dtype)
+            self._r_1_r_1_joint_mag = np.zeros((self._N,self._N), dtype=self._dtype)
 
         # Section unit vectors
         self._u_a = np.zeros((self._N,3))
         self._u_n = np.zeros((self._N,3))
         self._u_s = np.zeros((self._N,3))
+        if self._use_swept_sections:
+            self._u_a_unswept = np.zeros((self._N,3))
+            self._u_n_unswept = np.zeros((self._N,3))
         
         # Control point atmospheric properties
         self._rho = np.zeros(self._N) # Density
@@ -405,61 +464,65 @@ class Scene:
         # Image storage arrays
         if self.has_FS:
             # Image spatial node vectors and magnitudes
-            self._r_0_image = np.zeros((self._N, self._N, 3))
-            self._r_1_image = np.zeros((self._N, self._N, 3))
-            self._r_0_joint_image = np.zeros((self._N, self._N, 3))
-            self._r_1_joint_image = np.zeros((self._N, self._N, 3))
-            self._r_0_mag_image = np.zeros((self._N, self._N))
-            self._r_0_joint_mag_image = np.zeros((self._N, self._N))
-            self._r_1_mag_image = np.zeros((self._N, self._N))
-            self._r_1_joint_mag_image = np.zeros((self._N, self._N))
+            self._r_0_image = np.zeros((self._N, self._N, 3), dtype=self._dtype)
+            self._r_1_image = np.zeros((self._N, self._N, 3), dtype=self._dtype)
+            self._r_0_joint_image = np.zeros((self._N, self._N, 3), dtype=self._dtype)
+            self._r_1_joint_image = np.zeros((self._N, self._N, 3), dtype=self._dtype)
+            self._r_0_mag_image = np.zeros((self._N, self._N), dtype=self._dtype)
+            self._r_0_joint_mag_image = np.zeros((self._N, self._N), dtype=self._dtype)
+            self._r_1_mag_image = np.zeros((self._N, self._N), dtype=self._dtype)
+            self._r_1_joint_mag_image = np.zeros((self._N, self._N), dtype=self._dtype)
 
             # Image spatial node vector magnitude products
-            self._r_0_r_0_joint_mag_image = np.zeros((self._N, self._N))
-            self._r_0_r_1_mag_image = np.zeros((self._N, self._N))
-            self._r_1_r_1_joint_mag_image = np.zeros((self._N, self._N))
+            self._r_0_r_0_joint_mag_image = np.zeros((self._N, self._N), dtype=self._dtype)
+            self._r_0_r_1_mag_image = np.zeros((self._N, self._N), dtype=self._dtype)
+            self._r_1_r_1_joint_mag_image = np.zeros((self._N, self._N), dtype=self._dtype)
 
             # Image section unit vectors
             self._u_a_image = np.zeros((self._N, 3))
             self._u_n_image = np.zeros((self._N, 3))
             self._u_s_image = np.zeros((self._N, 3))
                                
-            # Image node locations
-            self._P0_image = np.zeros((self._N,self._N,3))
-            self._P1_image = np.zeros((self._N,self._N,3))
-            self._P0_joint_image = np.zeros((self._N,self._N,3))
-            self._P1_joint_image = np.zeros((self._N,self._N,3))
+            # Image node locations, as seen by the other aircraft
+            if self._num_aircraft > 1:
+                self._P0_image = np.zeros((self._N,3))
+                self._P1_image = np.zeros((self._N,3))
+                self._P0_joint_image = np.zeros((self._N,3))
+                self._P1_joint_image = np.zeros((self._N,3))
 
     def _store_aircraft_properties(self):
         # Get properties of the aircraft that don't change with state
 
-        index = 0
-        self._airplane_objects = []
-        self._airplane_slices = []
-
-        # Loop through airplanes
-        for _, airplane_object in self._airplanes.items():
+        # Store airplane objects to make sure they are always accessed in the same order
+        self._airplane_objects = list(self._airplanes.values())
 
-            # Store airplane objects to make sure they are always accessed in the same order
-            self._airplane_objects.append(airplane_object)
+        # Sections of the arrays belonging to each airplane
+        index = np.cumsum([0]+[airplane_object.N for airplane_object in self._airplane_objects]).tolist()
+        self._airplane_slices = [slice(start, stop) for start, stop in zip(index[:-1], index[1:])]
 
-            # Section of the arrays belonging to this airplane
-            airplane_N = airplane_object.N
-            airplane_slice = slice(index, index+airplane_N)
-            self._airplane_slices.append(airplane_slice)
+        # Index of the first control point of each segment and the rows of the per-segment arrays belonging to each airplane
+        num_cps = [segment.N for airplane_object in self._airplane_objects for segment in airplane_object.segments]
+        self._segment_starts = np.cumsum([0]+num_cps[:-1])
+        index = np.cumsum([0]+[len(airplane_object.segments) for airplane_object in self._airplane_objects]).tolist()
+        self._airplane_segment_slices = [slice(start, stop) for start, stop in zip(index[:-1], index[1:])]
+        self._airplane_segment_starts = np.array(index[:-1])
 
-            # Get properties
-            self._c_bar[airplane_slice] = airplane_object.c_bar
-            self._dS[airplane_slice] = airplane_object.dS
-            self._section_sweep[airplane_slice] = airplane_object.section_sweep
+        # Get properties
+        self._c_bar = np.concatenate([airplane_object.c_bar for airplane_object in self._airplane_objects])
+        self._dS = np.concatenate([airplane_object.dS for airplane_object in self._airplane_objects])
+        self._section_sweep = np.concatenate([airplane_object.section_sweep for airplane_object in self._airplane_objects])
 
-            index += airplane_N
+        # Sections of the arrays belonging to the other airplanes. These lie in at most two contiguous blocks, before and after each airplane
+        self._other_slices = []
+        for airplane_slice in self._airplane_slices:
+            self._other_slices.append([other_slice for other_slice in (slice(0, airplane_slice.start), slice(airplane_slice.stop, self._N)) if other_slice.start != other_slice.stop])
 
         # Swept section corrections based on thin airfoil theory
         if self._use_swept_sections:
-            C_lambda = np.cos(self._section_sweep)
-            self._c_bar *= C_lambda
-            self._C_sweep_inv = 1.0/C_lambda
+            self._C_sweep = np.cos(self._section_sweep)
+            self._C_sweep_inv = np.reciprocal(self._C_sweep)
+            self._aL0_sweep_factor = 1.0-self._C_sweep_inv # Used in correcting CL for sweep
+            self._c_bar *= self._C_sweep
 
         self._solved = False
 
@@ -472,6 +535,12 @@ class Scene:
         # geometry is updated, an aircraft is added to the scene, or the position or orientation
         # of an aircraft changes. Note that all calculations occur in the Earth-fixed frame.
 
+        # Free surface parameters used throughout the loop
+        has_FS = self.has_FS
+        FS_normal = self.FS_plane_normal
+        FS_height = self.FS_height
+        dtype = self._dtype
+
         # Loop through airplanes
         for airplane_object, airplane_slice in zip(self._airplane_objects, self._airplane_slices):
 
@@ -479,187 +548,163 @@ class Scene:
             q = airplane_object.q # orientation
             p = airplane_object.p_bar # airplane origin
 
-            # Get geometries
-            PC = quat_inv_trans(q, airplane_object.PC) # control point
-            self._r_CG[airplane_slice,:] = quat_inv_trans(q, airplane_object.PC_CG)
-            self._PC[airplane_slice,:] = p+PC
-            self._dl[airplane_slice,:] = quat_inv_trans(q, airplane_object.dl)
-
             # Get section vectors
+            # The unswept axial and normal vectors are also needed for the drag coefficient when using swept sections
             if self._use_swept_sections:
-                self._u_a[airplane_slice,:] = quat_inv_trans(q, airplane_object.u_a)
-                self._u_n[airplane_slice,:] = quat_inv_trans(q, airplane_object.u_n)
-                self._u_s[airplane_slice,:] = quat_inv_trans(q, airplane_object.u_s)
+                u = (airplane_object.u_a, airplane_object.u_n, airplane_object.u_s, airplane_object.u_a_unswept, airplane_object.u_n_unswept)
             else:
-                self._u_a[airplane_slice,:] = quat_inv_trans(q, airplane_object.u_a_unswept)
-                self._u_n[airplane_slice,:] = quat_inv_trans(q, airplane_object.u_n_unswept)
-                self._u_s[airplane_slice,:] = quat_inv_trans(q, airplane_object.u_s_unswept)
+                u = (airplane_object.u_a_unswept, airplane_object.u_n_unswept, airplane_object.u_s_unswept)
+
+            # Transform geometries and section vectors together
+            # PC is the control point, r_CG is the control point relative to the CG
+            transformed = quat_inv_trans(q, np.stack((airplane_object.PC, airplane_object.PC_CG, airplane_object.dl, *u)))
+            PC, self._r_CG[airplane_slice,:], self._dl[airplane_slice,:], self._u_a[airplane_slice,:], self._u_n[airplane_slice,:], self._u_s[airplane_slice,:] = transformed[:6]
+            if self._use_swept_sections:
+                self._u_a_unswept[airplane_slice,:], self._u_n_unswept[airplane_slice,:] = transformed[6:]
+            self._PC[airplane_slice,:] = p+PC
             
             # Calculate image vectors for FS calcs
-            if self.has_FS:
-                self._u_a_image[airplane_slice,:] = reflect_vector_3d(self._u_a[airplane_slice,:], self.FS_plane_normal, self.FS_height)
-                self._u_n_image[airplane_slice,:] = reflect_vector_3d(self._u_n[airplane_slice,:], self.FS_plane_normal, self.FS_height)
-                self._u_s_image[airplane_slice,:] = reflect_vector_3d(self._u_s[airplane_slice,:], self.FS_plane_normal, self.FS_height)
-
-            # Node locations
-            # Note the first index indicates which control point this is the effective LAC for
-            self._P0[airplane_slice,airplane_slice,:] = p+quat_inv_trans(q, airplane_object.P0_eff)
-            self._P1[airplane_slice,airplane_slice,:] = p+quat_inv_trans(q, airplane_object.P1_eff)
-            self._P0_joint[airplane_slice,airplane_slice,:] = p+quat_inv_trans(q, airplane_object.P0_joint_eff)
-            self._P1_joint[airplane_slice,airplane_slice,:] = p+quat_inv_trans(q, airplane_object.P1_joint_eff)
-            
-            # Image nodes for this craft
-            if self.has_FS:
-                self._P0_image[airplane_slice,airplane_slice,:] = reflect_vector_3d(self._P0[airplane_slice,airplane_slice,:], self.FS_plane_normal, self.FS_height)
-                self._P1_image[airplane_slice,airplane_slice,:] = reflect_vector_3d(self._P1[airplane_slice,airplane_slice,:], self.FS_plane_normal, self.FS_height)
-                self._P0_joint_image[airplane_slice,airplane_slice,:] = reflect_vector_3d(self._P0_joint[airplane_slice,airplane_slice,:], self.FS_plane_normal, self.FS_height)
-                self._P1_joint_image[airplane_slice,airplane_slice,:] = reflect_vector_3d(self._P1_joint[airplane_slice,airplane_slice,:], self.FS_plane_normal, self.FS_height)
-            
+            if has_FS:
+                self._u_a_image[airplane_slice,:] = reflect_vector_3d(self._u_a[airplane_slice,:], FS_normal, FS_height)
+                self._u_n_image[airplane_slice,:] = reflect_vector_3d(self._u_n[airplane_slice,:], FS_normal, FS_height)
+                self._u_s_image[airplane_slice,:] = reflect_vector_3d(self._u_s[airplane_slice,:], FS_normal, FS_height)
+
             # Get node locations for other aircraft from this aircraft
-            # This does not need to take the effective LAC into account
+            # This does not need to take the effective LAC into account, so the nodes are the same for every control point of the other aircraft
             if self._num_aircraft > 1:
-                this_ind = range(airplane_slice.start, airplane_slice.stop)
-                other_ind = [i for i in range(self._N) if i not in this_ind] # control point indices for other airplanes
-                self._P0[other_ind,airplane_slice,:] = p+quat_inv_trans(q, airplane_object.P0)
-                self._P1[other_ind,airplane_slice,:] = p+quat_inv_trans(q, airplane_object.P1)
-                self._P0_joint[other_ind,airplane_slice,:] = p+quat_inv_trans(q, airplane_object.P0_joint)
-                self._P1_joint[other_ind,airplane_slice,:] = p+quat_inv_trans(q, airplane_object.P1_joint)
-                
+                self._P0[airplane_slice,:], self._P1[airplane_slice,:], self._P0_joint[airplane_slice,:], self._P1_joint[airplane_slice,:] = \
+                    p+quat_inv_trans(q, np.stack((airplane_object.P0, airplane_object.P1, airplane_object.P0_joint, airplane_object.P1_joint)))
+
                 # Image
-                if self.has_FS:
-                    self._P0_image[other_ind,airplane_slice,:] = reflect_vector_3d(self._P0[other_ind,airplane_slice,:], self.FS_plane_normal, self.FS_height)
-                    self._P1_image[other_ind,airplane_slice,:] = reflect_vector_3d(self._P1[other_ind,airplane_slice,:], self.FS_plane_normal, self.FS_height)
-                    self._P0_joint_image[other_ind,airplane_slice,:] = reflect_vector_3d(self._P0_joint[other_ind,airplane_slice,:], self.FS_plane_normal, self.FS_height)
-                    self._P1_joint_image[other_ind,airplane_slice,:] = reflect_vector_3d(self._P1_joint[other_ind,airplane_slice,:], self.FS_plane_normal, self.FS_height)
-
-            # Spatial node vectors
-            self._r_0[airplane_slice,airplane_slice,:] = quat_inv_trans(q, airplane_object.r_0)
-            self._r_1[airplane_slice,airplane_slice,:] = quat_inv_trans(q, airplane_object.r_1)
-            self._r_0_joint[airplane_slice,airplane_slice,:] = quat_inv_trans(q, airplane_object.r_0_joint)
-            self._r_1_joint[airplane_slice,airplane_slice,:] = quat_inv_trans(q, airplane_object.r_1_joint)           
-
-            # Spatial node vector magnitudes
-            self._r_0_mag[airplane_slice,airplane_slice] = airplane_object.r_0_mag
-            self._r_0_joint_mag[airplane_slice,airplane_slice] = airplane_object.r_0_joint_mag
-            self._r_1_mag[airplane_slice,airplane_slice] = airplane_object.r_1_mag
-            self._r_1_joint_mag[airplane_slice,airplane_slice] = airplane_object.r_1_joint_mag
+                if has_FS:
+                    reflect_vector_3d(self._P0[airplane_slice,:], FS_normal, FS_height, out=self._P0_image[airplane_slice,:])
+                    reflect_vector_3d(self._P1[airplane_slice,:], FS_normal, FS_height, out=self._P1_image[airplane_slice,:])
+                    reflect_vector_3d(self._P0_joint[airplane_slice,:], FS_normal, FS_height, out=self._P0_joint_image[airplane_slice,:])
+                    reflect_vector_3d(self._P1_joint[airplane_slice,:], FS_normal, FS_height, out=self._P1_joint_image[airplane_slice,:])
+
+            # With a single aircraft, its blocks make up the whole of each array, so the arrays are stored
+            # directly rather than copied in. The scene never modifies the magnitude arrays, so those are
+            # shared with the airplane (unless they need to be cast to single precision).
+            if self._num_aircraft == 1:
 
-            # Spatial node vector magnitude products
-            self._r_0_r_0_joint_mag[airplane_slice,airplane_slice] = airplane_object.r_0_r_0_joint_mag
-            self._r_0_r_1_mag[airplane_slice,airplane_slice] = airplane_object.r_0_r_1_mag
-            self._r_1_r_1_joint_mag[airplane_slice,airplane_slice] = airplane_object.r_1_r_1_joint_mag
+                # Spatial node vectors
+                self._r_0 = quat_inv_trans(q, airplane_object.r_0.astype(dtype, copy=False))
+                self._r_1 = quat_inv_trans(q, airplane_object.r_1.astype(dtype, copy=False))
+                self._r_0_joint = quat_inv_trans(q, airplane_object.r_0_joint.astype(dtype, copy=False))
+                self._r_1_joint = quat_inv_trans(q, airplane_object.r_1_joint.astype(dtype, copy=False))
+
+                # Spatial node vector magnitudes
+                self._r_0_mag = airplane_object.r_0_mag.astype(dtype, copy=False)
+                self._r_0_joint_mag = airplane_object.r_0_joint_mag.astype(dtype, copy=False)
+                self._r_1_mag = airplane_object.r_1_mag.astype(dtype, copy=False)
+                self._r_1_joint_mag = airplane_object.r_1_joint_mag.astype(dtype, copy=False)
+
+                # Spatial node vector magnitude products
+                self._r_0_r_0_joint_mag = airplane_object.r_0_r_0_joint_mag.astype(dtype, copy=False)
+                self._r_0_r_1_mag = airplane_object.r_0_r_1_mag.astype(dtype, copy=False)
+                self._r_1_r_1_joint_mag = airplane_object.r_1_r_1_joint_mag.astype(dtype, copy=False)
+
+                if has_FS:
+                    # Image nodes
+                    self._r_0_image = quat_inv_trans(q, airplane_object.r_0_image.astype(dtype, copy=False))
+                    self._r_1_image = quat_inv_trans(q, airplane_object.r_1_image.astype(dtype, copy=False))
+                    self._r_0_joint_image = quat_inv_trans(q, airplane_object.r_0_joint_image.astype(dtype, copy=False))
+                    self._r_1_joint_image = quat_inv_trans(q, airplane_object.r_1_joint_image.astype(dtype, copy=False))
+
+                    # Image spatial node vector magnitudes
+                    self._r_0_mag_image = airplane_object.r_0_mag_image.astype(dtype, copy=False)
+                    self._r_0_joint_mag_image = airplane_object.r_0_joint_mag_image.astype(dtype, copy=False)
+                    self._r_1_mag_image = airplane_object.r_1_mag_image.astype(dtype, copy=False)
+                    self._r_1_joint_mag_image = airplane_object.r_1_joint_mag_image.astype(dtype, copy=False)
+
+                    # Image spatial node vector magnitude products
+                    self._r_0_r_0_joint_mag_image = airplane_object.r_0_r_0_joint_mag_image.astype(dtype, copy=False)
+                    self._r_0_r_1_mag_image = airplane_object.r_0_r_1_mag_image.astype(dtype, copy=False)
+                    self._r_1_r_1_joint_mag_image = airplane_object.r_1_r_1_joint_mag_image.astype(dtype, copy=False)
+
+            else:
+
+                # Spatial node vectors
+                self._r_0[airplane_slice,airplane_slice,:] = quat_inv_trans(q, airplane_object.r_0)
+                self._r_1[airplane_slice,airplane_slice,:] = quat_inv_trans(q, airplane_object.r_1)
+                self._r_0_joint[airplane_slice,airplane_slice,:] = quat_inv_trans(q, airplane_object.r_0_joint)
+                self._r_1_joint[airplane_slice,airplane_slice,:] = quat_inv_trans(q, airplane_object.r_1_joint)           
+
+                # Spatial node vector magnitudes
+                self._r_0_mag[airplane_slice,airplane_slice] = airplane_object.r_0_mag
+                self._r_0_joint_mag[airplane_slice,airplane_slice] = airplane_object.r_0_joint_mag
+                self._r_1_mag[airplane_slice,airplane_slice] = airplane_object.r_1_mag
+                self._r_1_joint_mag[airplane_slice,airplane_slice] = airplane_object.r_1_joint_mag
+
+                # Spatial node vector magnitude products
+                self._r_0_r_0_joint_mag[airplane_slice,airplane_slice] = airplane_object.r_0_r_0_joint_mag
+                self._r_0_r_1_mag[airplane_slice,airplane_slice] = airplane_object.r_0_r_1_mag
+                self._r_1_r_1_joint_mag[airplane_slice,airplane_slice] = airplane_object.r_1_r_1_joint_mag
             
-            if self.has_FS:
-                # Image nodes
-                self._r_0_image[airplane_slice,airplane_slice,:] = quat_inv_trans(q, airplane_object.r_0_image)
-                self._r_1_image[airplane_slice,airplane_slice,:] = quat_inv_trans(q, airplane_object.r_1_image)
-                self._r_0_joint_image[airplane_slice,airplane_slice,:] = quat_inv_trans(q, airplane_object.r_0_joint_image) 
-                self._r_1_joint_image[airplane_slice,airplane_slice,:] = quat_inv_trans(q, airplane_object.r_1_joint_image) 
+                if has_FS:
+                    # Image nodes
+                    self._r_0_image[airplane_slice,airplane_slice,:] = quat_inv_trans(q, airplane_object.r_0_image)
+                    self._r_1_image[airplane_slice,airplane_slice,:] = quat_inv_trans(q, airplane_object.r_1_image)
+                    self._r_0_joint_image[airplane_slice,airplane_slice,:] = quat_inv_trans(q, airplane_object.r_0_joint_image) 
+                    self._r_1_joint_image[airplane_slice,airplane_slice,:] = quat_inv_trans(q, airplane_object.r_1_joint_image) 
                             
-                # Image spatial node vector magnitudes
-                self._r_0_mag_image[airplane_slice,airplane_slice] = airplane_object.r_0_mag_image
-                self._r_0_joint_mag_image[airplane_slice,airplane_slice] = airplane_object.r_0_joint_mag_image
-                self._r_1_mag_image[airplane_slice,airplane_slice] = airplane_object.r_1_mag_image
-                self._r_1_joint_mag_image[airplane_slice,airplane_slice] = airplane_object.r_1_joint_mag_image
+                    # Image spatial node vector magnitudes
+                    self._r_0_mag_image[airplane_slice,airplane_slice] = airplane_object.r_0_mag_image
+                    self._r_0_joint_mag_image[airplane_slice,airplane_slice] = airplane_object.r_0_joint_mag_image
+                    self._r_1_mag_image[airplane_slice,airplane_slice] = airplane_object.r_1_mag_image
+                    self._r_1_joint_mag_image[airplane_slice,airplane_slice] = airplane_object.r_1_joint_mag_image
                 
-                # Image spatial node vector magnitude products
-                self._r_0_r_0_joint_mag_image[airplane_slice,airplane_slice] = airplane_object.r_0_r_0_joint_mag_image
-                self._r_0_r_1_mag_image[airplane_slice,airplane_slice] = airplane_object.r_0_r_1_mag_image
-                self._r_1_r_1_joint_mag_image[airplane_slice,airplane_slice] = airplane_object.r_1_r_1_joint_mag_image
+                    # Image spatial node vector magnitude products
+                    self._r_0_r_0_joint_mag_image[airplane_slice,airplane_slice] = airplane_object.r_0_r_0_joint_mag_image
+                    self._r_0_r_1_mag_image[airplane_slice,airplane_slice] = airplane_object.r_0_r_1_mag_image
+                    self._r_1_r_1_joint_mag_image[airplane_slice,airplane_slice] = airplane_object.r_1_r_1_joint_mag_image
     
         # Fill in spatial node vectors between airplanes
         # NOTE: The node imaging here may be incorrect.
         if self._num_aircraft > 1:
-            for airplane_slice in self._airplane_slices:
-                this_ind = range(airplane_slice.start, airplane_slice.stop)
-                other_ind = [i for i in range(self._N) if i not in this_ind] # control point indices for other airplanes
-
-                # Spatial node vectors
-                self._r_0[airplane_slice,other_ind,:] = self._PC[airplane_slice,np.newaxis,:]-self._P0[airplane_slice,other_ind,:]
-                self._r_1[airplane_slice,other_ind,:] = self._PC[airplane_slice,np.newaxis,:]-self._P1[airplane_slice,other_ind,:]
-                self._r_0_joint[airplane_slice,other_ind,:] = self._PC[airplane_slice,np.newaxis,:]-self._P0_joint[airplane_slice,other_ind,:]
-                self._r_1_joint[airplane_slice,other_ind,:] = self._PC[airplane_slice,np.newaxis,:]-self._P1_joint[airplane_slice,other_ind,:]
-
-                # Calculate spatial node vector magnitudes
-                self._r_0_mag[airplane_slice,other_ind] = np.sqrt(np.einsum('ijk,ijk->ij', self._r_0[airplane_slice,other_ind,:], self._r_0[airplane_slice,other_ind,:]))
-                self._r_0_joint_mag[airplane_slice,other_ind] = np.sqrt(np.einsum('ijk,ijk->ij', self._r_0_joint[airplane_slice,other_ind,:], self._r_0_joint[airplane_slice,other_ind,:]))
-                self._r_1_mag[airplane_slice,other_ind] = np.sqrt(np.einsum('ijk,ijk->ij', self._r_1[airplane_slice,other_ind,:], self._r_1[airplane_slice,other_ind,:]))
-                self._r_1_joint_mag[airplane_slice,other_ind] = np.sqrt(np.einsum('ijk,ijk->ij', self._r_1_joint[airplane_slice,other_ind,:], self._r_1_joint[airplane_slice,other_ind,:]))
-                
-                # Calculate magnitude products
-                self._r_0_r_0_joint_mag[airplane_slice,other_ind] = self._r_0_mag[airplane_slice,other_ind]*self._r_0_joint_mag[airplane_slice,other_ind]
-                self._r_0_r_1_mag[airplane_slice,other_ind] = self._r_0_mag[airplane_slice,other_ind]*self._r_1_mag[airplane_slice,other_ind]
-                self._r_1_r_1_joint_mag[airplane_slice,other_ind] = self._r_1_mag[airplane_slice,other_ind]*self._r_1_joint_mag[airplane_slice,other_ind]
-                
-                if self.has_FS:
-                    # Image spatial node vectors
-                    self._r_0_image[airplane_slice,other_ind,:] = self._PC[airplane_slice,np.newaxis,:]-self._P0_image[airplane_slice,other_ind,:]
-                    self._r_1_image[airplane_slice,other_ind,:] = self._PC[airplane_slice,np.newaxis,:]-self._P1_image[airplane_slice,other_ind,:]
-                    self._r_0_joint_image[airplane_slice,other_ind,:] = self._PC[airplane_slice,np.newaxis,:]-self._P0_joint_image[airplane_slice,other_ind,:]
-                    self._r_1_joint_image[airplane_slice,other_ind,:] = self._PC[airplane_slice,np.newaxis,:]-self._P1_joint_image[airplane_slice,other_ind,:]
+            for airplane_slice, other_slices in zip(self._airplane_slices, self._other_slices):
+                PC = self._PC[airplane_slice]
+                for other_slice in other_slices:
+
+                    # Spatial node vectors, magnitudes, and magnitude products
+                    spatial_node_vectors(PC,
+                                         (self._P0[other_slice], self._P1[other_slice], self._P0_joint[other_slice], self._P1_joint[other_slice]),
+                                         (self._r_0[airplane_slice,other_slice], self._r_1[airplane_slice,other_slice], self._r_0_joint[airplane_slice,other_slice], self._r_1_joint[airplane_slice,other_slice]),
+                                         (self._r_0_mag[airplane_slice,other_slice], self._r_1_mag[airplane_slice,other_slice], self._r_0_joint_mag[airplane_slice,other_slice], self._r_1_joint_mag[airplane_slice,other_slice]),
+                                         (self._r_0_r_0_joint_mag[airplane_slice,other_slice], self._r_0_r_1_mag[airplane_slice,other_slice], self._r_1_r_1_joint_mag[airplane_slice,other_slice]))
                     
-                    # Calculate image spatial node vector magnitudes
-                    self._r_0_mag_image[airplane_slice,other_ind] = np.sqrt(np.einsum('ijk,ijk->ij', self._r_0_image[airplane_slice,other_ind,:], self._r_0_image[airplane_slice,other_ind,:]))
-                    self._r_0_joint_mag_image[airplane_slice,other_ind] = np.sqrt(np.einsum('ijk,ijk->ij', self._r_0_joint_image[airplane_slice,other_ind,:], self._r_0_joint_image[airplane_slice,other_ind,:]))
-                    self._r_1_mag_image[airplane_slice,other_ind] = np.sqrt(np.einsum('ijk,ijk->ij', self._r_1_image[airplane_slice,other_ind,:], self._r_1_image[airplane_slice,other_ind,:]))
-                    self._r_1_joint_mag_image[airplane_slice,other_ind] = np.sqrt(np.einsum('ijk,ijk->ij', self._r_1_joint_image[airplane_slice,other_ind,:], self._r_1_joint_image[airplane_slice,other_ind,:]))
-                    
-                    # Calculate image magnitude products
-                    self._r_0_r_0_joint_mag_image[airplane_slice,other_ind] = self._r_0_mag_image[airplane_slice,other_ind]*self._r_0_joint_mag_image[airplane_slice,other_ind]
-                    self._r_0_r_1_mag_image[airplane_slice,other_ind] = self._r_0_mag_image[airplane_slice,other_ind]*self._r_1_mag_image[airplane_slice,other_ind]
-                    self._r_1_r_1_joint_mag_image[airplane_slice,other_ind] = self._r_1_mag_image[airplane_slice,other_ind]*self._r_1_joint_mag_image[airplane_slice,other_ind]
+                    if self.has_FS:
+                        # Image spatial node vectors, magnitudes, and magnitude products
+                        spatial_node_vectors(PC,
+                                             (self._P0_image[other_slice], self._P1_image[other_slice], self._P0_joint_image[other_slice], self._P1_joint_image[other_slice]),
+                                             (self._r_0_image[airplane_slice,other_slice], self._r_1_image[airplane_slice,other_slice], self._r_0_joint_image[airplane_slice,other_slice], self._r_1_joint_image[airplane_slice,other_slice]),
+                                             (self._r_0_mag_image[airplane_slice,other_slice], self._r_1_mag_image[airplane_slice,other_slice], self._r_0_joint_mag_image[airplane_slice,other_slice], self._r_1_joint_mag_image[airplane_slice,other_slice]),
+                                             (self._r_0_r_0_joint_mag_image[airplane_slice,other_slice], self._r_0_r_1_mag_image[airplane_slice,other_slice], self._r_1_r_1_joint_mag_image[airplane_slice,other_slice]))
 
         # In-plane projection matrices
         if self._use_in_plane:
-            self._P_in_plane = np.repeat(np.identity(3)[np.newaxis,:,:], self._N, axis=0)-np.matmul(self._u_s[:,:,np.newaxis], self._u_s[:,np.newaxis,:])
+            self._P_in_plane = np.identity(3)-self._u_s[:,:,np.newaxis]*self._u_s[:,np.newaxis,:]
 
         # Influence of bound and jointed vortex segments
         with np.errstate(divide='ignore', invalid='ignore'):
-
-            # Bound
-            numer = ((self._r_0_mag+self._r_1_mag)[:,:,np.newaxis]*np.cross(self._r_0, self._r_1))
-            denom = self._r_0_r_1_mag*(self._r_0_r_1_mag+np.einsum('ijk,ijk->ij', self._r_0, self._r_1))
-            V_ji_bound = np.true_divide(numer, denom[:,:,np.newaxis])
-            V_ji_bound[np.diag_indices(self._N)] = 0.0 # Ensure this actually comes out to be zero
-            
-            # Jointed inbound trailing vortex (subscript 0)
-            numer = (self._r_0_joint_mag+self._r_0_mag)[:,:,np.newaxis]*np.cross(self._r_0_joint, self._r_0)
-            denom = self._r_0_r_0_joint_mag*(self._r_0_r_0_joint_mag+np.einsum('ijk,ijk->ij', self._r_0_joint, self._r_0))
-            V_ji_joint_0 = np.true_divide(numer, denom[:,:,np.newaxis])
-
-            # Jointed outbound trailing vortex (subscript 1)
-            numer = (self._r_1_joint_mag+self._r_1_mag)[:,:,np.newaxis]*np.cross(self._r_1, self._r_1_joint)
-            denom = self._r_1_r_1_joint_mag*(self._r_1_r_1_joint_mag+np.einsum('ijk,ijk->ij', self._r_1, self._r_1_joint))
-            V_ji_joint_1 = np.true_divide(numer, denom[:,:,np.newaxis])
+            self._V_ji_const = bound_and_jointed_vortex_influence((self._r_0, self._r_1, self._r_0_joint, self._r_1_joint),
+                                                                  (self._r_0_mag, self._r_1_mag, self._r_0_joint_mag, self._r_1_joint_mag),
+                                                                  (self._r_0_r_0_joint_mag, self._r_0_r_1_mag, self._r_1_r_1_joint_mag))
             
             if self.has_FS:
-                # Bound image
-                numer = ((self._r_0_mag_image+self._r_1_mag_image)[:,:,np.newaxis]*np.cross(self._r_0_image, self._r_1_image))
-                denom = self._r_0_r_1_mag_image*(self._r_0_r_1_mag_image+np.einsum('ijk,ijk->ij', self._r_0_image, self._r_1_image))
-                V_ji_bound_image = np.true_divide(numer, denom[:,:,np.newaxis])
-                V_ji_bound_image[np.diag_indices(self._N)] = 0.0 # Ensure this actually comes out to be zero
-                                       
-                # Image jointed inbound trailing vortex (subscript 0)
-                numer = (self._r_0_joint_mag_image+self._r_0_mag_image)[:,:,np.newaxis]*np.cross(self._r_0_joint_image, self._r_0_image)
-                denom = self._r_0_r_0_joint_mag_image*(self._r_0_r_0_joint_mag_image+np.einsum('ijk,ijk->ij', self._r_0_joint_image, self._r_0_image))
-                V_ji_joint_0_image = np.true_divide(numer, denom[:,:,np.newaxis])
-                
-                # Image jointed inbound trailing vortex (subscript 1)
-                numer = (self._r_1_joint_mag_image+self._r_1_mag_image)[:,:,np.newaxis]*np.cross(self._r_1_image, self._r_1_joint_image)
-                denom = self._r_1_r_1_joint_mag_image*(self._r_1_r_1_joint_mag_image+np.einsum('ijk,ijk->ij', self._r_1_image, self._r_1_joint_image))
-                V_ji_joint_1_image = np.true_divide(numer, denom[:,:,np.newaxis])
-                
-                # Sum image
-                self._V_ji_const_image = V_ji_bound_image+V_ji_joint_0_image+V_ji_joint_1_image
-
-            # Sum
-            self._V_ji_const = V_ji_bound+V_ji_joint_0+V_ji_joint_1
+                self._V_ji_const_image = bound_and_jointed_vortex_influence((self._r_0_image, self._r_1_image, self._r_0_joint_image, self._r_1_joint_image),
+                                                                            (self._r_0_mag_image, self._r_1_mag_image, self._r_0_joint_mag_image, self._r_1_joint_mag_image),
+                                                                            (self._r_0_r_0_joint_mag_image, self._r_0_r_1_mag_image, self._r_1_r_1_joint_mag_image))
 
         # Atmospheric wind, density, speed of sound, and viscosity
+        # Constant properties come back as scalars or broadcast views, so nothing is evaluated or copied per control point
         self._rho = self._get_density(self._PC)
         self._nu = self._get_viscosity(self._PC)
         self._a = self._get_sos(self._PC)
-        self._v_wind[:,:] = self._get_wind(self._PC)
+        self._v_wind = self._get_wind(self._PC)
+
+        # The influence matrix must be recalculated for the new geometry
+        self._V_ji_flow_state = None
 
         self._solved = False
 # ********************************************************************
@@ -686,19 +731,24 @@ class Scene:
             v_trans = -airplane_object.v # freestream velocity
             w = airplane_object.w # angular rate
 
+            # Velocities due to rotation at the control points and, if needed, the joints for determining trailing vortex direction
+            # These are transformed together; -w x r is written as r x w
+            if self._match_machup_pro:
+                v_rot = quat_inv_trans(airplane_object.q, cross_3d(airplane_object.PC_CG, w))
+            else:
+                r = np.stack((airplane_object.PC_CG, airplane_object.P0_joint-airplane_object.CG, airplane_object.P1_joint-airplane_object.CG))
+                v_rot, P0_joint_v_rot, P1_joint_v_rot = quat_inv_trans(airplane_object.q, cross_3d(r, w))
+
             # Control point velocities
-            v_rot = quat_inv_trans(airplane_object.q, -np.cross(w, airplane_object.PC_CG))
             v_wind = self._v_wind[airplane_slice]
             self._v_inf[airplane_slice,:] = v_trans+v_wind
             self._v_inf_and_rot[airplane_slice,:] = self._v_inf[airplane_slice,:]+v_rot
             
-            # Joint velocities for determining trailing vortex direction
+            # Joint velocities
             if self._match_machup_pro:
                 self._P0_joint_v_inf[airplane_slice,:] = v_trans+v_wind
                 self._P1_joint_v_inf[airplane_slice,:] = v_trans+v_wind
             else:
-                P0_joint_v_rot = quat_inv_trans(airplane_object.q, -np.cross(w, airplane_object.P0_joint-airplane_object.CG[np.newaxis,:]))
-                P1_joint_v_rot = quat_inv_trans(airplane_object.q, -np.cross(w, airplane_object.P1_joint-airplane_object.CG[np.newaxis,:]))
                 self._P0_joint_v_inf[airplane_slice,:] = v_trans+v_wind+P0_joint_v_rot
                 self._P1_joint_v_inf[airplane_slice,:] = v_trans+v_wind+P1_joint_v_rot
 
@@ -709,8 +759,8 @@ class Scene:
         self._u_inf_and_rot = self._v_inf_and_rot/self._V_inf_and_rot[:,np.newaxis]
 
         # Calculate the direction of the trailing vortices
-        self._u_trailing_0 = self._P0_joint_v_inf/np.linalg.norm(self._P0_joint_v_inf, axis=-1, keepdims=True)
-        self._u_trailing_1 = self._P1_joint_v_inf/np.linalg.norm(self._P1_joint_v_inf, axis=-1, keepdims=True)
+        self._u_trailing_0 = normalize_3d(self._P0_joint_v_inf)
+        self._u_trailing_1 = normalize_3d(self._P1_joint_v_inf)
 
         # Constrain trailing vortex directions, if need be
         if self._constrain_vortex_sheet:
@@ -728,15 +778,61 @@ class Scene:
                 self._u_trailing_1[airplane_slice] = np.matmul(P[np.newaxis,:,:], self._u_trailing_1[airplane_slice,:,np.newaxis]).reshape((N,3))
 
             # Renormalize
-            self._u_trailing_0 = self._u_trailing_0/np.linalg.norm(self._u_trailing_0, axis=-1, keepdims=True)
-            self._u_trailing_1 = self._u_trailing_1/np.linalg.norm(self._u_trailing_1, axis=-1, keepdims=True)
+            self._u_trailing_0 = normalize_3d(self._u_trailing_0)
+            self._u_trailing_1 = normalize_3d(self._u_trailing_1)
             
         # Image vectors
         if self.has_FS:
             self._u_trailing_0_image = reflect_vector_3d(self._u_trailing_0, self.FS_plane_normal, self.FS_height)
             self._u_trailing_1_image = reflect_vector_3d(self._u_trailing_1, self.FS_plane_normal, self.FS_height)
                 
-        # Calculate V_ji
+        # The influence matrix depends upon the flow only through the directions of the trailing vortices (and the
+        # freestream speed, for the wave corrections), so it is only recalculated when these have changed.
+        if self._V_ji_flow_state is None or not all(np.array_equal(x, x_prev) for x, x_prev in zip(self._get_V_ji_flow_state(), self._V_ji_flow_state)):
+            self._calc_V_ji()
+            self._V_ji_flow_state = self._get_V_ji_flow_state()
+
+        # Get effective freesream and calculate initial approximation for airfoil parameters (Re and M are only used in the linear solution)
+        if self._use_in_plane:
+            self._v_inf_in_plane = self._project_in_plane(self._v_inf)
+            self._V_inf_in_plane = np.linalg.norm(self._v_inf_in_plane, axis=1)
+            self._v_inf_and_rot_in_plane = self._project_in_plane(self._v_inf_and_rot)
+            self._V_inf_and_rot_in_plane = np.linalg.norm(self._v_inf_and_rot_in_plane, axis=1)
+            self._Re = self._V_inf_and_rot_in_plane*self._c_bar/self._nu
+            self._M = self._V_inf_in_plane/self._a
+        else:
+            self._Re = self._V_inf*self._c_bar/self._nu
+            self._M = self._V_inf/self._a
+
+        # Get estimate of angle of attack
+        v_n_inf = np.einsum('ij,ij->i', self._v_inf_and_rot, self._u_n)
+        v_a_inf = np.einsum('ij,ij->i', self._v_inf_and_rot, self._u_a)
+        self._alpha_inf = np.arctan2(v_n_inf, v_a_inf)
+
+        # Get lift slopes and zero-lift angles of attack for each segment
+        for airplane_object, airplane_slice in zip(self._airplane_objects, self._airplane_slices):
+            Re = self._Re[airplane_slice]
+            M = self._M[airplane_slice]
+            self._CLa[airplane_slice], self._CL[airplane_slice] = airplane_object.get_cp_coefs(self._alpha_inf[airplane_slice], Re, M, ["get_CLa", "get_CL"])
+            self._aL0[airplane_slice], = airplane_object.get_cp_coefs(np.zeros_like(Re), Re, M, ["get_aL0"]) # Need to pass a dummy variable for alpha
+
+        # Correct CL estimate for sweep
+        if self._use_swept_sections:
+            self._correct_CL_for_sweep()
+
+        self._solved = False
+
+
+    def _get_V_ji_flow_state(self):
+        # Returns the flow quantities the influence matrix depends upon
+        if self.use_wave_corrections:
+            return self._u_trailing_0, self._u_trailing_1, self._V_inf
+        return self._u_trailing_0, self._u_trailing_1
+
+
+    def _calc_V_ji(self):
+        # Calculates the influence of each horseshoe vortex on each control point
+
         # Influence of vortex segment 0 after the joint; ignore if the radius goes to zero.
         # Problem is, if the radius almost goes to zero, that can blow up the influence matrix without making it a nan.
         # The where statement I've added can take care of this, but then the decision has to be made as to where to cut
@@ -747,89 +843,75 @@ class Scene:
         denom0 = (self._r_0_joint_mag*(self._r_0_joint_mag-np.einsum('ijk,ijk->ij', self._u_trailing_0[np.newaxis], self._r_0_joint)))
         if (np.abs(denom0)<self._impingement_threshold).any():
             warnings.warn("""MachUpX detected a trailing vortex impinging upon a control point. This can lead to greatly exaggerated induced velocities at the control point. See "Common Issues" in the documentation for more information. This warning can be suppressed by reducing "impingement_threshold" in the solver parameters.""")
-        V_ji_due_to_0 = np.where(denom0[:,:,np.newaxis]>1e-13, np.nan_to_num(-np.cross(self._u_trailing_0, self._r_0_joint)/denom0[:,:,np.newaxis]), 0.0)
+        V_ji_due_to_0 = self._trailing_vortex_influence(cross_3d(self._r_0_joint, self._u_trailing_0), denom0)
 
         # Influence of vortex segment 1 after the joint
         denom1 = (self._r_1_joint_mag*(self._r_1_joint_mag-np.einsum('ijk,ijk->ij', self._u_trailing_1[np.newaxis], self._r_1_joint)))
         if (np.abs(denom1)<self._impingement_threshold).any():
             warnings.warn("""MachUpX detected a trailing vortex impinging upon a control point. This can lead to greatly exaggerated induced velocities at the control point. See "Common Issues" in the documentation for more information. This warning can be suppressed by reducing "impingement_threshold" in the solver parameters.""")
-        V_ji_due_to_1 = np.where(denom1[:,:,np.newaxis]>1e-13, np.nan_to_num(np.cross(self._u_trailing_1, self._r_1_joint)/denom1[:,:,np.newaxis]), 0.0)
+        V_ji_due_to_1 = self._trailing_vortex_influence(cross_3d(self._u_trailing_1, self._r_1_joint), denom1)
         
         if self.has_FS:
             # Image vortex influence, inbound
             denom0_image = (self._r_0_joint_mag_image*(self._r_0_joint_mag_image-np.einsum('ijk,ijk->ij', self._u_trailing_1_image[np.newaxis], self._r_0_joint_image)))
-            V_ji_due_to_0_image = np.where(denom0_image[:,:,np.newaxis]>1e-13, np.nan_to_num(-np.cross(self._u_trailing_0_image, self._r_0_joint_image)/denom0_image[:,:,np.newaxis]), 0.0)
+            V_ji_due_to_0_image = self._trailing_vortex_influence(cross_3d(self._r_0_joint_image, self._u_trailing_0_image), denom0_image)
             
             # Image vortex influence, outbound
             denom1_image = (self._r_1_joint_mag_image*(self._r_1_joint_mag_image-np.einsum('ijk,ijk->ij', self._u_trailing_1_image[np.newaxis], self._r_1_joint_image)))
-            V_ji_due_to_1_image = np.where(denom1_image[:,:,np.newaxis]>1e-13, np.nan_to_num(np.cross(self._u_trailing_1_image, self._r_1_joint_image)/denom1_image[:,:,np.newaxis]), 0.0)
+            V_ji_due_to_1_image = self._trailing_vortex_influence(cross_3d(self._u_trailing_1_image, self._r_1_joint_image), denom1_image)
             
             # Wave potential influence (see Nishiyama's Linearized Steady Theory of Hydrofoils)
-            g = 9.81 # acceleration due to gravity in [m/s^2]
-            K0 = self._V_inf**2 / g
-            y_CP = self._PC[:,1] # control point y_coords
-            arg_K = 1/2*K0*(y_CP**2 + 4*self.submergence**2)**0.5
-            V_ji_due_to_wave = -(4*self.submergence**2 - y_CP**2) / ((4*self.submergence**2 + y_CP**2)**2) + (K0*2)/2 * np.exp(-K0*self.submergence) * \
-                ((1 + 4*self.submergence**2 / (y_CP**2+4*self.submergence**2)) * sp.k0(arg_K) + \
-                2*(2*self.submergence/((4*self.submergence**2 + y_CP**2)**0.5) - 1/(K0*(4*self.submergence**2 + y_CP**2)**0.5) + 8*self.submergence**2/(K0*(4*self.submergence**2 + y_CP**2)**1.5)) * sp.k1(arg_K))
+            if self.use_wave_corrections:
+                g = 9.81 # acceleration due to gravity in [m/s^2]
+                K0 = self._V_inf**2 / g
+                y_CP_2 = self._PC[:,1]**2 # control point y_coords squared
+                h_2 = 4*self.submergence**2
+                d_2 = h_2 + y_CP_2
+                d = np.sqrt(d_2)
+                arg_K = 0.5*K0*d
+                V_ji_due_to_wave = -(h_2 - y_CP_2)/(d_2*d_2) + K0*np.exp(-K0*self.submergence) * \
+                    ((1 + h_2/d_2) * sp.k0(arg_K) + \
+                    2*(2*self.submergence/d - 1/(K0*d) + 2*h_2/(K0*d_2*d)) * sp.k1(arg_K))
         
         # Sum
         # By the definition of V_ji, the first index is the control point, the second index is the horseshoe vortex, and the third index is the vector components
         # Check if formulations need to account for a free surface or ground effect.
-        if self.has_FS and self.FS_biplane_boundary:
-            self._V_ji = 1/(4*np.pi)*(V_ji_due_to_0+self._V_ji_const+V_ji_due_to_1 + (V_ji_due_to_0_image+self._V_ji_const_image+V_ji_due_to_1_image))
-        elif self.has_FS and not self.FS_biplane_boundary:
-            self._V_ji = 1/(4*np.pi)*(V_ji_due_to_0+self._V_ji_const+V_ji_due_to_1 - (V_ji_due_to_0_image+self._V_ji_const_image+V_ji_due_to_1_image))
-        else:
-            self._V_ji = 1/(4*np.pi)*(V_ji_due_to_0+self._V_ji_const+V_ji_due_to_1)
+        # The sums are accumulated in place in the arrays for the inbound trailing vortices, so no further (N,N,3) arrays are allocated.
+        self._V_ji = V_ji_due_to_0
+        self._V_ji += self._V_ji_const
+        self._V_ji += V_ji_due_to_1
+        if self.has_FS:
+            V_ji_due_to_0_image += self._V_ji_const_image
+            V_ji_due_to_0_image += V_ji_due_to_1_image
+            if self.FS_biplane_boundary:
+                self._V_ji += V_ji_due_to_0_image
+            else:
+                self._V_ji -= V_ji_due_to_0_image
+        self._V_ji *= 1/(4*np.pi)
         
         # WARNING: experimental
         # Add induced velocity due to waves to the induced velocities at each control point
-        if self.use_wave_corrections:         
-            array_list = []
-            for i in range(V_ji_due_to_wave.shape[0]):
-                template = np.zeros((self._N,3))
-                row = np.asarray([0,0,V_ji_due_to_wave[i]])
-                template[i,:] = row
-                #rep_row = np.tile(row, (self._N, 1))
-                array_list.append(template)
-            fin_array = np.stack(array_list)
-            self._V_ji += 1/(4*np.pi) * fin_array
-                            
-        
-        # Get effective freesream and calculate initial approximation for airfoil parameters (Re and M are only used in the linear solution)
-        if self._use_in_plane:
-            self._v_inf_in_plane = np.matmul(self._P_in_plane, self._v_inf[:,:,np.newaxis]).reshape((self._N,3))
-            self._V_inf_in_plane = np.linalg.norm(self._v_inf_in_plane, axis=1)
-            self._v_inf_and_rot_in_plane = np.matmul(self._P_in_plane, self._v_inf_and_rot[:,:,np.newaxis]).reshape((self._N,3))
-            self._V_inf_and_rot_in_plane = np.linalg.norm(self._v_inf_and_rot_in_plane, axis=1)
-            self._Re = self._V_inf_and_rot_in_plane*self._c_bar/self._nu
-            self._M = self._V_inf_in_plane/self._a
-        else:
-            self._Re = self._V_inf*self._c_bar/self._nu
-            self._M = self._V_inf/self._a
+        if self.use_wave_corrections:
+            # Each control point is only influenced by its own wave potential, in the z direction
+            self._V_ji[self._diag_ind+(2,)] += 1/(4*np.pi)*V_ji_due_to_wave
 
-        # Get estimate of angle of attack
-        v_n_inf = np.einsum('ij,ij->i', self._v_inf_and_rot, self._u_n)
-        v_a_inf = np.einsum('ij,ij->i', self._v_inf_and_rot, self._u_a)
-        self._alpha_inf = np.arctan2(v_n_inf, v_a_inf)
 
-        # Get lift slopes and zero-lift angles of attack for each segment
-        for airplane_object, airplane_slice in zip(self._airplane_objects, self._airplane_slices):
-            seg_ind = 0
-            for segment in airplane_object.segments:
-                seg_N = segment.N
-                seg_slice = slice(airplane_slice.start+seg_ind, airplane_slice.start+seg_ind+seg_N)
-                self._CLa[seg_slice] = segment.get_cp_CLa(self._alpha_inf[seg_slice], self._Re[seg_slice], self._M[seg_slice])
-                self._CL[seg_slice] = segment.get_cp_CL(self._alpha_inf[seg_slice], self._Re[seg_slice], self._M[seg_slice])
-                self._aL0[seg_slice] = segment.get_cp_aL0(self._Re[seg_slice], self._M[seg_slice])
-                seg_ind += seg_N
+    def _project_in_plane(self, v):
+        # Applies the in-plane projection matrices to the vectors v. v may be of shape (N,3) or, for influences
+        # such as V_ji, (N,N,3), in which case the projection at each control point (first index) is applied.
+        if v.ndim == 2:
+            return np.einsum('ijk,ik->ij', self._P_in_plane, v)
+        else:
+            # The projection matrices are symmetric, so this is one batched matrix product per control point
+            return np.matmul(v, self._P_in_plane)
 
-        # Correct CL estimate for sweep
-        if self._use_swept_sections:
-            self._correct_CL_for_sweep()
 
-        self._solved = False
+    def _trailing_vortex_influence(self, u_x_r, denom):
+        # Divides the cross products of the trailing vortex directions and spatial node vectors by the denominators of
+        # the semi-infinite vortex influence, in place. Influences with vanishing denominators are ignored by dividing
+        # them by infinity instead, so no NaNs or infinities are produced.
+        u_x_r /= np.where(denom>1e-13, denom, np.inf)[:,:,np.newaxis]
+        return u_x_r
 # ********************************************************************
 
 
@@ -879,8 +961,8 @@ class Scene:
         self._calc_v_i()
 
         # Get vortex lift
-        self._w_i = np.cross(self._v_i, self._dl)
-        self._w_i_mag = np.linalg.norm(self._w_i, axis=1)
+        self._w_i = cross_3d(self._v_i, self._dl)
+        self._w_i_mag = np.sqrt(np.einsum('ij,ij->i', self._w_i, self._w_i))
         L_vortex = 2.0*self._w_i_mag*self._gamma
         
         # Get section lift
@@ -892,7 +974,8 @@ class Scene:
 
     def _calc_v_i(self):
         # Determines the local velocity at each control point
-        self._v_i = self._v_inf_and_rot+np.einsum('ijk,j->ik', self._V_ji, self._gamma)
+        # gamma @ V_ji is a batched matrix-vector product over the control points, which is dispatched to BLAS
+        self._v_i = self._v_inf_and_rot+np.matmul(self._gamma, self._V_ji)
 
     
     def _get_section_lift(self):
@@ -900,7 +983,7 @@ class Scene:
 
         # Get section properties
         if self._use_in_plane:
-            self._v_i_in_plane = np.matmul(self._P_in_plane, self._v_i[:,:,np.newaxis]).reshape((self._N,3))
+            self._v_i_in_plane = self._project_in_plane(self._v_i)
             self._V_i_in_plane_2 = np.einsum('ij,ij->i', self._v_i_in_plane, self._v_i_in_plane)
             self._V_i_in_plane = np.sqrt(self._V_i_in_plane_2)
 
@@ -919,22 +1002,9 @@ class Scene:
         self._alpha = np.arctan2(self._v_n, self._v_a)
 
         # Loop through airplanes
-        index = 0
-        for airplane_object in self._airplane_objects:
-            N = airplane_object.N
-
-            # Loop through segments
-            seg_ind = 0
-            for segment in airplane_object.segments:
-                seg_N = segment.N
-                seg_slice = slice(index+seg_ind, index+seg_ind+seg_N)
-                self._CLa[seg_slice] = segment.get_cp_CLa(self._alpha[seg_slice], self._Re[seg_slice], self._M[seg_slice])
-                self._CL[seg_slice] = segment.get_cp_CL(self._alpha[seg_slice], self._Re[seg_slice], self._M[seg_slice])
-                self._CLRe[seg_slice] = segment.get_cp_CLRe(self._alpha[seg_slice], self._Re[seg_slice], self._M[seg_slice])
-                self._CLM[seg_slice] = segment.get_cp_CLM(self._alpha[seg_slice], self._Re[seg_slice], self._M[seg_slice])
-                seg_ind += seg_N
-
-            index += N
+        for airplane_object, airplane_slice in zip(self._airplane_objects, self._airplane_slices):
+            self._CLa[airplane_slice], self._CL[airplane_slice], self._CLRe[airplane_slice], self._CLM[airplane_slice] = \
+                airplane_object.get_cp_coefs(self._alpha[airplane_slice], self._Re[airplane_slice], self._M[airplane_slice], ["get_CLa", "get_CL", "get_CLRe", "get_CLM"])
 
         # Return lift to match MU Pro
         if self._match_machup_pro:
@@ -960,7 +1030,7 @@ class Scene:
     def _correct_CL_for_sweep(self):
         # Applies thin-airfoil corrections for swept section lift based on local lift slope
 
-        self._CL += self._CLa*(self._aL0-self._aL0*self._C_sweep_inv) # New method
+        self._CL += self._CLa*self._aL0*self._aL0_sweep_factor # New method
 
 # ********************************************************************
     def _solve_linear(self, **kwargs):
@@ -990,7 +1060,7 @@ class Scene:
         A[self._diag_ind] += 2.0*np.linalg.norm(V_inf_and_rot_x_dl, axis=1)
 
         # Solve
-        self._gamma = np.linalg.solve(A, b)
+        self._gamma = slinalg.solve(A, b, overwrite_a=True, overwrite_b=True, check_finite=False)
 
         return time.time()-start_time
 # ********************************************************************
@@ -1010,10 +1080,14 @@ class Scene:
 
         # Calculate the derivative of induced velocity wrt vortex strength
         if self._use_in_plane:
-            V_ji = np.matmul(self._P_in_plane, self._V_ji[:,:,:,np.newaxis]).reshape((self._N,self._N,3))
+            V_ji = self._project_in_plane(self._V_ji)
         else:
             V_ji = self._V_ji
 
+        # These do not change between iterations
+        V_ji_x_dl = cross_3d(V_ji, self._dl)
+        V_ji_u_n, V_ji_u_a = np.moveaxis(np.matmul(V_ji, np.stack((self._u_n, self._u_a), axis=-1)), -1, 0)
+
         iteration = 0
         error = 100
         while error > self._solver_convergence:
@@ -1024,13 +1098,14 @@ class Scene:
             error = np.linalg.norm(R)
 
             # Intermediate calcs
+            # Batched matrix products are much faster than einsums over V_ji
             if self._use_in_plane:
-                v_iji = np.einsum('ijk,ijk->ij', self._v_i_in_plane[:,np.newaxis,:], V_ji)
+                v_iji = np.matmul(V_ji, self._v_i_in_plane[:,:,np.newaxis])[:,:,0]
             else:
-                v_iji = np.einsum('ijk,ijk->ij', self._v_i[:,np.newaxis,:], V_ji)
+                v_iji = np.matmul(V_ji, self._v_i[:,:,np.newaxis])[:,:,0]
 
             # Caclulate Jacobian
-            J[:,:] = (2*self._gamma/self._w_i_mag)[:,np.newaxis]*(np.einsum('ijk,ijk->ij', self._w_i[:,np.newaxis,:], np.cross(V_ji, self._dl)))
+            J[:,:] = (2*self._gamma/self._w_i_mag)[:,np.newaxis]*np.matmul(V_ji_x_dl, self._w_i[:,:,np.newaxis])[:,:,0]
 
             if self._use_total_velocity:
                 J[:,:] -= (2*self._dS*self._CL)[:,np.newaxis]*v_iji # Comes from taking the derivative of V_i^2 with respect to gamma
@@ -1042,7 +1117,7 @@ class Scene:
                 CL_gamma_Re = self._CLRe[:,np.newaxis]*self._c_bar/(self._nu*self._V_i)[:,np.newaxis]*v_iji
                 CL_gamma_M = self._CLM[:,np.newaxis]/(self._a*self._V_i)[:,np.newaxis]*v_iji
 
-            CL_gamma_alpha = self._CLa[:,np.newaxis]*(self._v_a[:,np.newaxis]*np.einsum('ijk,ijk->ij', V_ji, self._u_n[:,np.newaxis])-self._v_n[:,np.newaxis]*np.einsum('ijk,ijk->ij', V_ji, self._u_a[:,np.newaxis]))/(self._v_n*self._v_n+self._v_a*self._v_a)[:,np.newaxis]
+            CL_gamma_alpha = self._CLa[:,np.newaxis]*(self._v_a[:,np.newaxis]*V_ji_u_n-self._v_n[:,np.newaxis]*V_ji_u_a)/(self._v_n*self._v_n+self._v_a*self._v_a)[:,np.newaxis]
 
             if self._use_total_velocity:
                 if self._use_in_plane:
@@ -1055,11 +1130,10 @@ class Scene:
                 else:
                     J[:,:] -= (self._V_inf*self._V_inf*self._dS)[:,np.newaxis]*(CL_gamma_alpha+CL_gamma_Re+CL_gamma_M)
 
-            diag_ind = np.diag_indices(self._N)
-            J[diag_ind] += 2*self._w_i_mag
+            J[self._diag_ind] += 2*self._w_i_mag
 
             # Get gamma update
-            dGamma = np.linalg.solve(J, -R)
+            dGamma = slinalg.solve(J, -R, overwrite_a=True, overwrite_b=True, check_finite=False)
 
             # Update gamma
             self._gamma = self._gamma+self._solver_relaxation*dGamma
@@ -1089,6 +1163,15 @@ class Scene:
         wind_frame = kwargs.get("wind_frame", True)
         return body_frame, stab_frame, wind_frame
 
+
+    def _solve_perturbed_forces(self, **kwargs):
+        # Solves for the nondimensional forces and moments at a perturbed state for the
+        # finite-difference derivatives. Outputs these never read (dimensional results,
+        # segment breakdowns, and file export) are skipped.
+        solve_kwargs = dict(kwargs, non_dimensional=True, dimensional=False, report_by_segment=False)
+        solve_kwargs.pop("filename", None)
+        return self.solve_forces(**solve_kwargs)
+
 # ********************************************************************
     def _integrate_forces_and_moments(self, **kwargs):
         # Determines the forces and moments on each lifting surface
@@ -1105,17 +1188,17 @@ class Scene:
             self._gamma *= (self._V_inf_and_rot/self._V_inf)**2
 
         # Get velocities
-        if self._use_total_velocity or self._match_machup_pro:
+        if self._integrate_with_v_i:
             self._calc_v_i()
             self._V_i_2 = np.einsum('ij,ij->i', self._v_i, self._v_i)
             self._V_i = np.sqrt(self._V_i_2)
             self._u_i = self._v_i/self._V_i[:,np.newaxis]
             if self._use_in_plane:
-                self._v_i_in_plane = np.matmul(self._P_in_plane, self._v_i[:,:,np.newaxis]).reshape((self._N,3))
+                self._v_i_in_plane = self._project_in_plane(self._v_i)
                 self._V_i_in_plane_2 = np.einsum('ij,ij->i', self._v_i_in_plane, self._v_i_in_plane)
 
         # Calculate vortex force differential elements
-        self._dF_inv = (self._rho*self._gamma)[:,np.newaxis]*np.cross(self._v_i, self._dl)
+        self._dF_inv = (self._rho*self._gamma)[:,np.newaxis]*cross_3d(self._v_i, self._dl)
 
         # Calculate conditions for determining viscous contributions
         self._v_a = np.einsum('ij,ij->i', self._v_i, self._u_a)
@@ -1125,14 +1208,8 @@ class Scene:
             self._Re_unswept = self._V_i*self._c_bar*self._C_sweep_inv/self._nu
 
             # Calculate unswept angle of attack for determining drag coefficient
-            u_a = np.zeros_like(self._u_a)
-            u_n = np.zeros_like(self._u_n)
-            for airplane_object, airplane_slice in zip(self._airplane_objects, self._airplane_slices):
-                q = airplane_object.q
-                u_a[airplane_slice,:] = quat_inv_trans(q, airplane_object.u_a_unswept)
-                u_n[airplane_slice,:] = quat_inv_trans(q, airplane_object.u_n_unswept)
-            v_a = np.einsum('ij,ij->i', self._v_i, u_a)
-            v_n = np.einsum('ij,ij->i', self._v_i, u_n)
+            v_a = np.einsum('ij,ij->i', self._v_i, self._u_a_unswept)
+            v_n = np.einsum('ij,ij->i', self._v_i, self._u_n_unswept)
             alpha_unswept = np.arctan2(v_n, v_a)
 
         else:
@@ -1156,6 +1233,12 @@ class Scene:
             if self._use_in_plane:
                 self._redim_in_plane = 0.5*self._rho*self._V_inf_in_plane*self._V_inf_in_plane*self._dS
 
+        # Redimensionalization parameter for section moments, which includes the chord
+        if self._use_in_plane:
+            self._redim_section = self._redim_in_plane*self._c_bar
+        else:
+            self._redim_section = self._redim_full*self._c_bar
+
         # Store lift, drag, and moment coefficient distributions
         empty_coef_dict = {}
         empty_FM_dict = {}
@@ -1170,63 +1253,46 @@ class Scene:
             empty_FM_dict.update({"FL" : {}, "FD" : {}, "FS" : {}, "Mx_w" : {}, "My_w" : {}, "Mz_w" : {}})
 
         # Get section moment and drag coefficients
-        index = 0
-        for airplane_object in self._airplane_objects:
-            for segment in airplane_object.segments:
-                num_cps = segment.N
-                cur_slice = slice(index, index+num_cps)
-
-                # Section drag coefficient
-                if self._use_swept_sections:
-                    self._CD[cur_slice] = segment.get_cp_CD(alpha_unswept[cur_slice], self._Re_unswept[cur_slice], self._M[cur_slice])
-                else:
-                    self._CD[cur_slice] = segment.get_cp_CD(self._alpha[cur_slice], self._Re_unswept[cur_slice], self._M[cur_slice])
+        for airplane_object, airplane_slice in zip(self._airplane_objects, self._airplane_slices):
+            M = self._M[airplane_slice]
 
-                # Section moment coefficient
-                self._Cm[cur_slice] = segment.get_cp_Cm(self._alpha[cur_slice], self._Re[cur_slice], self._M[cur_slice])
+            # Section drag coefficient
+            if self._use_swept_sections:
+                self._CD[airplane_slice], = airplane_object.get_cp_coefs(alpha_unswept[airplane_slice], self._Re_unswept[airplane_slice], M, ["get_CD"])
+            else:
+                self._CD[airplane_slice], = airplane_object.get_cp_coefs(self._alpha[airplane_slice], self._Re_unswept[airplane_slice], M, ["get_CD"])
 
-                index += num_cps
+            # Section moment coefficient
+            self._Cm[airplane_slice], = airplane_object.get_cp_coefs(self._alpha[airplane_slice], self._Re[airplane_slice], M, ["get_Cm"])
 
         # Correct section moment coefficient for sweep
         if self._use_swept_sections:
-            self._Cm = self._Cm*self._C_sweep_inv
+            self._Cm *= self._C_sweep_inv
 
         # Inviscid moment due to sectional properties
-        if self._use_in_plane:
-            dM_section = (self._redim_in_plane*self._c_bar*self._Cm)[:,np.newaxis]*self._u_s
-        else:
-            dM_section = (self._redim_full*self._c_bar*self._Cm)[:,np.newaxis]*self._u_s
+        self._dM_inv = (self._redim_section*self._Cm)[:,np.newaxis]*self._u_s
 
         # Inviscid moment due to vortex lift and total inviscid moment
-        dM_vortex = np.cross(self._r_CG, self._dF_inv)
-        self._dM_inv = dM_vortex+dM_section
+        self._dM_inv += cross_3d(self._r_CG, self._dF_inv)
 
         # Determine viscous drag vector
-        dD = self._redim_full*self._CD
-        if self._use_total_velocity or self._match_machup_pro:
-            self._dF_visc = dD[:,np.newaxis]*self._u_i
-        else:
-            self._dF_visc = dD[:,np.newaxis]*self._u_inf
+        u_drag = self._u_i if self._integrate_with_v_i else self._u_inf
+        self._dF_visc = (self._redim_full*self._CD)[:,np.newaxis]*u_drag
 
         # Moment due to viscous drag
-        self._dM_visc = np.cross(self._r_CG, self._dF_visc)
+        self._dM_visc = cross_3d(self._r_CG, self._dF_visc)
+
+        # Sum the differential elements over each segment
+        # These are stacked so the sums and rotations below are each done in one call
+        FM_segments = np.add.reduceat(np.stack((self._dF_inv, self._dM_inv, self._dF_visc, self._dM_visc), axis=1), self._segment_starts, axis=0)
+
+        # Sum the segments belonging to each airplane to get the totals
+        FM_airplanes = np.add.reduceat(FM_segments, self._airplane_segment_starts, axis=0)
 
         # Loop through airplanes to gather necessary data
-        index = 0
-        for airplane_object in self._airplane_objects:
+        for i, airplane_object in enumerate(self._airplane_objects):
             airplane_name = airplane_object.name
 
-            # Initialize totals
-            if body_frame:
-                FM_b_inv_airplane_total = np.zeros(6)
-                FM_b_vis_airplane_total = np.zeros(6)
-            if wind_frame:
-                FM_w_inv_airplane_total = np.zeros(6)
-                FM_w_vis_airplane_total = np.zeros(6)
-            if stab_frame:
-                FM_s_inv_airplane_total = np.zeros(6)
-                FM_s_vis_airplane_total = np.zeros(6)
-
             # Initialize dictionary keys
             self._FM[airplane_name] = {
                 "inviscid" : {},
@@ -1234,344 +1300,99 @@ class Scene:
                 "total" : {}
             }
             if non_dimensional:
-                self._FM[airplane_name]["inviscid"] = copy.deepcopy(empty_coef_dict)
-                self._FM[airplane_name]["viscous"] = copy.deepcopy(empty_coef_dict)
+                self._FM[airplane_name]["inviscid"] = {key : {} for key in empty_coef_dict}
+                self._FM[airplane_name]["viscous"] = {key : {} for key in empty_coef_dict}
             if dimensional:
-                self._FM[airplane_name]["inviscid"].update(copy.deepcopy(empty_FM_dict))
-                self._FM[airplane_name]["viscous"].update(copy.deepcopy(empty_FM_dict))
+                self._FM[airplane_name]["inviscid"].update({key : {} for key in empty_FM_dict})
+                self._FM[airplane_name]["viscous"].update({key : {} for key in empty_FM_dict})
 
             # Determine reference freestream vector in body-fixed frame (used for resolving L, D, and S)
-            v_inf = -airplane_object.v + self._get_wind(airplane_object.p_bar)
-            V_inf = np.linalg.norm(v_inf)
-            u_inf = quat_trans(airplane_object.q, (v_inf/V_inf).flatten())
+            # These are 3-vectors, so the components are handled as floats to avoid numpy call overhead
+            v_x, v_y, v_z = (-airplane_object.v + self._get_wind(airplane_object.p_bar)).flatten().tolist()
+            V_inf = m.sqrt(v_x*v_x+v_y*v_y+v_z*v_z)
+            rot_to_body = quat_to_matrix(airplane_object.q)
+            u_x, u_y, u_z = np.dot(rot_to_body, [v_x/V_inf, v_y/V_inf, v_z/V_inf]).tolist()
 
             # Determine rotations to wind and stability frames
             if stab_frame or wind_frame:
-                u_lift = np.cross(u_inf, [0.,1.,0.])
-                u_lift = u_lift/np.linalg.norm(u_lift)
+                # u_lift = u_inf x [0,1,0], normalized
+                l_inv = 1.0/m.sqrt(u_x*u_x+u_z*u_z)
+                l_x = -u_z*l_inv
+                l_z = u_x*l_inv
             if stab_frame:
-                u_x_stab = np.cross(u_lift, [0.0, 1.0, 0.0])
-                u_x_stab = u_x_stab/np.linalg.norm(u_x_stab)
-                rot_to_stab = np.array([u_x_stab, [0.0, 1.0, 0.0], -u_lift])
+                # The stability x axis is u_lift x [0,1,0]
+                rot_to_stab = np.array([[-l_z, 0.0, l_x], [0.0, 1.0, 0.0], [-l_x, 0.0, -l_z]])
             if wind_frame:
-                u_side = np.cross(u_lift, u_inf)
-                u_side = u_side/np.linalg.norm(u_side)
-                rot_to_wind = np.array([u_inf, u_side, u_lift])
+                # u_side = u_lift x u_inf, normalized
+                s_x = -l_z*u_y
+                s_y = l_z*u_x-l_x*u_z
+                s_z = l_x*u_y
+                s_inv = 1.0/m.sqrt(s_x*s_x+s_y*s_y+s_z*s_z)
+                rot_to_wind = np.array([[u_x, u_y, u_z], [s_x*s_inv, s_y*s_inv, s_z*s_inv], [l_x, 0.0, l_z]])
+
+            # Rotations from the Earth-fixed frame to each requested frame, in the order they are reported
+            frames = []
+            rot_to_frames = []
+            if body_frame:
+                frames.append("body")
+                rot_to_frames.append(rot_to_body)
+            if stab_frame:
+                frames.append("stab")
+                rot_to_frames.append(np.matmul(rot_to_stab, rot_to_body))
+            if wind_frame:
+                frames.append("wind")
+                rot_to_frames.append(np.matmul(rot_to_wind, rot_to_body))
+
+            # Stored transposed, since the vectors being rotated are rows
+            rot_to_frames_T = np.transpose(np.array(rot_to_frames).reshape((-1,3,3)), (0,2,1))
 
             # Determine reference parameters
             if non_dimensional:
                 non_dim_inv = 2.0/(self._get_density(airplane_object.p_bar)*V_inf*V_inf*airplane_object.S_w)
                 lat_non_dim_inv = non_dim_inv/airplane_object.l_ref_lat
                 lon_non_dim_inv = non_dim_inv/airplane_object.l_ref_lon
+                FM_non_dim_inv = np.array([non_dim_inv, non_dim_inv, non_dim_inv, lat_non_dim_inv, lon_non_dim_inv, lat_non_dim_inv]).flatten()
+
+            # Store the forces and moments on each segment
+            # The segment sums are rotated into all requested frames at once, giving an array arranged as [frame, segment, (inviscid, viscous), (F, M)]
+            if report_by_segment:
+                segment_names = [segment.name for segment in airplane_object.segments]
+                FM_segments_airplane = FM_segments[np.newaxis,self._airplane_segment_slices[i]]
+                FM_segments_frames = np.matmul(FM_segments_airplane, rot_to_frames_T[:,np.newaxis]).reshape((len(frames),len(segment_names),2,6))
+                if non_dimensional:
+                    for frame, FM_frame in zip(frames, FM_segments_frames*FM_non_dim_inv):
+                        self._store_by_segment(self._FM[airplane_name], _COEF_KEYS[frame], segment_names, FM_frame)
+                if dimensional:
+                    for frame, FM_frame in zip(frames, FM_segments_frames):
+                        self._store_by_segment(self._FM[airplane_name], _FM_KEYS[frame], segment_names, FM_frame)
+
+            # Store totals
+            # These are rotated into all requested frames at once, giving an array arranged as [frame, (inviscid, viscous), (F, M)]
+            FM_totals = np.matmul(FM_airplanes[i], rot_to_frames_T).reshape((-1,2,6))
+            if non_dimensional:
+                for frame, (FM_inv_total, FM_vis_total) in zip(frames, FM_totals*FM_non_dim_inv):
+                    self._store_totals(self._FM[airplane_name], _COEF_KEYS[frame], FM_inv_total, FM_vis_total)
+            if dimensional:
+                for frame, (FM_inv_total, FM_vis_total) in zip(frames, FM_totals):
+                    self._store_totals(self._FM[airplane_name], _FM_KEYS[frame], FM_inv_total, FM_vis_total)
 
-            # Loop through segments
-            for segment in airplane_object.segments:
-                num_cps = segment.N
-                segment_name = segment.name
-                cur_slice = slice(index, index+num_cps)
-
-                # Get drag coef and redimensionalize
-                F_b_visc = quat_trans(airplane_object.q, np.sum(self._dF_visc[cur_slice], axis=0))
-
-                # Determine viscous moment vector
-                M_b_visc = quat_trans(airplane_object.q, np.sum(self._dM_visc[cur_slice], axis=0))
-
-                # Determine inviscid force vector
-                F_b_inv = quat_trans(airplane_object.q, np.sum(self._dF_inv[cur_slice], axis=0))
-
-                # Determine inviscid moment vector
-                M_b_inv = quat_trans(airplane_object.q, np.sum(self._dM_inv[cur_slice], axis=0))
-
-                # Rotate frames
-                if wind_frame:
-                    F_w_visc = np.matmul(rot_to_wind, F_b_visc)
-                    F_w_inv = np.matmul(rot_to_wind, F_b_inv)
-                    M_w_visc = np.matmul(rot_to_wind, M_b_visc)
-                    M_w_inv = np.matmul(rot_to_wind, M_b_inv)
-                if stab_frame:
-                    F_s_visc = np.matmul(rot_to_stab, F_b_visc)
-                    F_s_inv = np.matmul(rot_to_stab, F_b_inv)
-                    M_s_visc = np.matmul(rot_to_stab, M_b_visc)
-                    M_s_inv = np.matmul(rot_to_stab, M_b_inv)
-
-                # Store
-                if report_by_segment:
-                    if non_dimensional:
-                        if body_frame:
-                            self._FM[airplane_name]["viscous"]["Cx"][segment_name] = F_b_visc[0].item()*non_dim_inv
-                            self._FM[airplane_name]["viscous"]["Cy"][segment_name] = F_b_visc[1].item()*non_dim_inv
-                            self._FM[airplane_name]["viscous"]["Cz"][segment_name] = F_b_visc[2].item()*non_dim_inv
-
-                            self._FM[airplane_name]["viscous"]["Cl"][segment_name] = M_b_visc[0].item()*lat_non_dim_inv
-                            self._FM[airplane_name]["viscous"]["Cm"][segment_name] = M_b_visc[1].item()*lon_non_dim_inv
-                            self._FM[airplane_name]["viscous"]["Cn"][segment_name] = M_b_visc[2].item()*lat_non_dim_inv
-
-                            self._FM[airplane_name]["inviscid"]["Cx"][segment_name] = F_b_inv[0].item()*non_dim_inv
-                            self._FM[airplane_name]["inviscid"]["Cy"][segment_name] = F_b_inv[1].item()*non_dim_inv
-                            self._FM[airplane_name]["inviscid"]["Cz"][segment_name] = F_b_inv[2].item()*non_dim_inv
-
-                            self._FM[airplane_name]["inviscid"]["Cl"][segment_name] = M_b_inv[0].item()*lat_non_dim_inv
-                            self._FM[airplane_name]["inviscid"]["Cm"][segment_name] = M_b_inv[1].item()*lon_non_dim_inv
-                            self._FM[airplane_name]["inviscid"]["Cn"][segment_name] = M_b_inv[2].item()*lat_non_dim_inv
-
-                        if wind_frame:
-                            self._FM[airplane_name]["viscous"]["CD"][segment_name] = F_w_visc[0].item()*non_dim_inv
-                            self._FM[airplane_name]["viscous"]["CS"][segment_name] = F_w_visc[1].item()*non_dim_inv
-                            self._FM[airplane_name]["viscous"]["CL"][segment_name] = F_w_visc[2].item()*non_dim_inv
-
-                            self._FM[airplane_name]["viscous"]["Cl_w"][segment_name] = M_w_visc[0].item()*lat_non_dim_inv
-                            self._FM[airplane_name]["viscous"]["Cm_w"][segment_name] = M_w_visc[1].item()*lon_non_dim_inv
-                            self._FM[airplane_name]["viscous"]["Cn_w"][segment_name] = M_w_visc[2].item()*lat_non_dim_inv
-
-                            self._FM[airplane_name]["inviscid"]["CD"][segment_name] = F_w_inv[0].item()*non_dim_inv
-                            self._FM[airplane_name]["inviscid"]["CS"][segment_name] = F_w_inv[1].item()*non_dim_inv
-                            self._FM[airplane_name]["inviscid"]["CL"][segment_name] = F_w_inv[2].item()*non_dim_inv
-
-                            self._FM[airplane_name]["inviscid"]["Cl_w"][segment_name] = M_w_inv[0].item()*lat_non_dim_inv
-                            self._FM[airplane_name]["inviscid"]["Cm_w"][segment_name] = M_w_inv[1].item()*lon_non_dim_inv
-                            self._FM[airplane_name]["inviscid"]["Cn_w"][segment_name] = M_w_inv[2].item()*lat_non_dim_inv
-
-                        if stab_frame:
-                            self._FM[airplane_name]["viscous"]["Cx_s"][segment_name] = F_s_visc[0].item()*non_dim_inv
-                            self._FM[airplane_name]["viscous"]["Cy_s"][segment_name] = F_s_visc[1].item()*non_dim_inv
-                            self._FM[airplane_name]["viscous"]["Cz_s"][segment_name] = F_s_visc[2].item()*non_dim_inv
-
-                            self._FM[airplane_name]["viscous"]["Cl_s"][segment_name] = M_s_visc[0].item()*lat_non_dim_inv
-                            self._FM[airplane_name]["viscous"]["Cm_s"][segment_name] = M_s_visc[1].item()*lon_non_dim_inv
-                            self._FM[airplane_name]["viscous"]["Cn_s"][segment_name] = M_s_visc[2].item()*lat_non_dim_inv
-
-                            self._FM[airplane_name]["inviscid"]["Cx_s"][segment_name] = F_s_inv[0].item()*non_dim_inv
-                            self._FM[airplane_name]["inviscid"]["Cy_s"][segment_name] = F_s_inv[1].item()*non_dim_inv
-                            self._FM[airplane_name]["inviscid"]["Cz_s"][segment_name] = F_s_inv[2].item()*non_dim_inv
-
-                            self._FM[airplane_name]["inviscid"]["Cl_s"][segment_name] = M_s_inv[0].item()*lat_non_dim_inv
-                            self._FM[airplane_name]["inviscid"]["Cm_s"][segment_name] = M_s_inv[1].item()*lon_non_dim_inv
-                            self._FM[airplane_name]["inviscid"]["Cn_s"][segment_name] = M_s_inv[2].item()*lat_non_dim_inv
-
-                    if dimensional:
-                        if body_frame:
-                            self._FM[airplane_name]["viscous"]["Fx"][segment_name] = F_b_visc[0].item()
-                            self._FM[airplane_name]["viscous"]["Fy"][segment_name] = F_b_visc[1].item()
-                            self._FM[airplane_name]["viscous"]["Fz"][segment_name] = F_b_visc[2].item()
-
-                            self._FM[airplane_name]["viscous"]["Mx"][segment_name] = M_b_visc[0].item()
-                            self._FM[airplane_name]["viscous"]["My"][segment_name] = M_b_visc[1].item()
-                            self._FM[airplane_name]["viscous"]["Mz"][segment_name] = M_b_visc[2].item()
-
-                            self._FM[airplane_name]["inviscid"]["Fx"][segment_name] = F_b_inv[0].item()
-                            self._FM[airplane_name]["inviscid"]["Fy"][segment_name] = F_b_inv[1].item()
-                            self._FM[airplane_name]["inviscid"]["Fz"][segment_name] = F_b_inv[2].item()
-
-                            self._FM[airplane_name]["inviscid"]["Mx"][segment_name] = M_b_inv[0].item()
-                            self._FM[airplane_name]["inviscid"]["My"][segment_name] = M_b_inv[1].item()
-                            self._FM[airplane_name]["inviscid"]["Mz"][segment_name] = M_b_inv[2].item()
-
-                        if wind_frame:
-                            self._FM[airplane_name]["viscous"]["FD"][segment_name] = F_w_visc[0].item()
-                            self._FM[airplane_name]["viscous"]["FS"][segment_name] = F_w_visc[1].item()
-                            self._FM[airplane_name]["viscous"]["FL"][segment_name] = F_w_visc[2].item()
-
-                            self._FM[airplane_name]["inviscid"]["FD"][segment_name] = F_w_inv[0].item()
-                            self._FM[airplane_name]["inviscid"]["FS"][segment_name] = F_w_inv[1].item()
-                            self._FM[airplane_name]["inviscid"]["FL"][segment_name] = F_w_inv[2].item()
-
-                            self._FM[airplane_name]["viscous"]["Mx_w"][segment_name] = M_w_visc[0].item()
-                            self._FM[airplane_name]["viscous"]["My_w"][segment_name] = M_w_visc[1].item()
-                            self._FM[airplane_name]["viscous"]["Mz_w"][segment_name] = M_w_visc[2].item()
-
-                            self._FM[airplane_name]["inviscid"]["Mx_w"][segment_name] = M_w_inv[0].item()
-                            self._FM[airplane_name]["inviscid"]["My_w"][segment_name] = M_w_inv[1].item()
-                            self._FM[airplane_name]["inviscid"]["Mz_w"][segment_name] = M_w_inv[2].item()
-
-                        if stab_frame:
-                            self._FM[airplane_name]["viscous"]["Fx_s"][segment_name] = F_s_visc[0].item()
-                            self._FM[airplane_name]["viscous"]["Fy_s"][segment_name] = F_s_visc[1].item()
-                            self._FM[airplane_name]["viscous"]["Fz_s"][segment_name] = F_s_visc[2].item()
-
-                            self._FM[airplane_name]["viscous"]["Mx_s"][segment_name] = M_s_visc[0].item()
-                            self._FM[airplane_name]["viscous"]["My_s"][segment_name] = M_s_visc[1].item()
-                            self._FM[airplane_name]["viscous"]["Mz_s"][segment_name] = M_s_visc[2].item()
-
-                            self._FM[airplane_name]["inviscid"]["Fx_s"][segment_name] = F_s_inv[0].item()
-                            self._FM[airplane_name]["inviscid"]["Fy_s"][segment_name] = F_s_inv[1].item()
-                            self._FM[airplane_name]["inviscid"]["Fz_s"][segment_name] = F_s_inv[2].item()
-
-                            self._FM[airplane_name]["inviscid"]["Mx_s"][segment_name] = M_s_inv[0].item()
-                            self._FM[airplane_name]["inviscid"]["My_s"][segment_name] = M_s_inv[1].item()
-                            self._FM[airplane_name]["inviscid"]["Mz_s"][segment_name] = M_s_inv[2].item()
-
-                # Sum up totals
-                if body_frame:
-                    FM_b_inv_airplane_total[:3] += F_b_inv
-                    FM_b_inv_airplane_total[3:] += M_b_inv
-                    FM_b_vis_airplane_total[:3] += F_b_visc
-                    FM_b_vis_airplane_total[3:] += M_b_visc
-                if wind_frame:
-                    FM_w_inv_airplane_total[:3] += F_w_inv
-                    FM_w_inv_airplane_total[3:] += M_w_inv
-                    FM_w_vis_airplane_total[:3] += F_w_visc
-                    FM_w_vis_airplane_total[3:] += M_w_visc
-                if stab_frame:
-                    FM_s_inv_airplane_total[:3] += F_s_inv
-                    FM_s_inv_airplane_total[3:] += M_s_inv
-                    FM_s_vis_airplane_total[:3] += F_s_visc
-                    FM_s_vis_airplane_total[3:] += M_s_visc
+        return time.time()-start_time
 
-                index += num_cps
 
-            if non_dimensional:
-                if body_frame:
-                    self._FM[airplane_name]["inviscid"]["Cx"]["total"] = FM_b_inv_airplane_total[0].item()*non_dim_inv
-                    self._FM[airplane_name]["inviscid"]["Cy"]["total"] = FM_b_inv_airplane_total[1].item()*non_dim_inv
-                    self._FM[airplane_name]["inviscid"]["Cz"]["total"] = FM_b_inv_airplane_total[2].item()*non_dim_inv
-                    self._FM[airplane_name]["inviscid"]["Cl"]["total"] = FM_b_inv_airplane_total[3].item()*lat_non_dim_inv
-                    self._FM[airplane_name]["inviscid"]["Cm"]["total"] = FM_b_inv_airplane_total[4].item()*lon_non_dim_inv
-                    self._FM[airplane_name]["inviscid"]["Cn"]["total"] = FM_b_inv_airplane_total[5].item()*lat_non_dim_inv
-
-                    # Store the total viscous force and moment
-                    self._FM[airplane_name]["viscous"]["Cx"]["total"] = FM_b_vis_airplane_total[0].item()*non_dim_inv
-                    self._FM[airplane_name]["viscous"]["Cy"]["total"] = FM_b_vis_airplane_total[1].item()*non_dim_inv
-                    self._FM[airplane_name]["viscous"]["Cz"]["total"] = FM_b_vis_airplane_total[2].item()*non_dim_inv
-                    self._FM[airplane_name]["viscous"]["Cl"]["total"] = FM_b_vis_airplane_total[3].item()*lat_non_dim_inv
-                    self._FM[airplane_name]["viscous"]["Cm"]["total"] = FM_b_vis_airplane_total[4].item()*lon_non_dim_inv
-                    self._FM[airplane_name]["viscous"]["Cn"]["total"] = FM_b_vis_airplane_total[5].item()*lat_non_dim_inv
-
-                    # Determine total force and moment for the airplane
-                    FM_b_airplane_total = FM_b_vis_airplane_total+FM_b_inv_airplane_total
-                    self._FM[airplane_name]["total"]["Cx"] = FM_b_airplane_total[0].item()*non_dim_inv
-                    self._FM[airplane_name]["total"]["Cy"] = FM_b_airplane_total[1].item()*non_dim_inv
-                    self._FM[airplane_name]["total"]["Cz"] = FM_b_airplane_total[2].item()*non_dim_inv
-                    self._FM[airplane_name]["total"]["Cl"] = FM_b_airplane_total[3].item()*lat_non_dim_inv
-                    self._FM[airplane_name]["total"]["Cm"] = FM_b_airplane_total[4].item()*lon_non_dim_inv
-                    self._FM[airplane_name]["total"]["Cn"] = FM_b_airplane_total[5].item()*lat_non_dim_inv
-
-                if stab_frame:
-                    self._FM[airplane_name]["inviscid"]["Cx_s"]["total"] = FM_s_inv_airplane_total[0].item()*non_dim_inv
-                    self._FM[airplane_name]["inviscid"]["Cy_s"]["total"] = FM_s_inv_airplane_total[1].item()*non_dim_inv
-                    self._FM[airplane_name]["inviscid"]["Cz_s"]["total"] = FM_s_inv_airplane_total[2].item()*non_dim_inv
-                    self._FM[airplane_name]["inviscid"]["Cl_s"]["total"] = FM_s_inv_airplane_total[3].item()*lat_non_dim_inv
-                    self._FM[airplane_name]["inviscid"]["Cm_s"]["total"] = FM_s_inv_airplane_total[4].item()*lon_non_dim_inv
-                    self._FM[airplane_name]["inviscid"]["Cn_s"]["total"] = FM_s_inv_airplane_total[5].item()*lat_non_dim_inv
-
-                    # Store the total viscous force and moment
-                    self._FM[airplane_name]["viscous"]["Cx_s"]["total"] = FM_s_vis_airplane_total[0].item()*non_dim_inv
-                    self._FM[airplane_name]["viscous"]["Cy_s"]["total"] = FM_s_vis_airplane_total[1].item()*non_dim_inv
-                    self._FM[airplane_name]["viscous"]["Cz_s"]["total"] = FM_s_vis_airplane_total[2].item()*non_dim_inv
-                    self._FM[airplane_name]["viscous"]["Cl_s"]["total"] = FM_s_vis_airplane_total[3].item()*lat_non_dim_inv
-                    self._FM[airplane_name]["viscous"]["Cm_s"]["total"] = FM_s_vis_airplane_total[4].item()*lon_non_dim_inv
-                    self._FM[airplane_name]["viscous"]["Cn_s"]["total"] = FM_s_vis_airplane_total[5].item()*lat_non_dim_inv
-
-                    # Determine total force and moment for the airplane
-                    FM_s_airplane_total = FM_s_vis_airplane_total+FM_s_inv_airplane_total
-                    self._FM[airplane_name]["total"]["Cx_s"] = FM_s_airplane_total[0].item()*non_dim_inv
-                    self._FM[airplane_name]["total"]["Cy_s"] = FM_s_airplane_total[1].item()*non_dim_inv
-                    self._FM[airplane_name]["total"]["Cz_s"] = FM_s_airplane_total[2].item()*non_dim_inv
-                    self._FM[airplane_name]["total"]["Cl_s"] = FM_s_airplane_total[3].item()*lat_non_dim_inv
-                    self._FM[airplane_name]["total"]["Cm_s"] = FM_s_airplane_total[4].item()*lon_non_dim_inv
-                    self._FM[airplane_name]["total"]["Cn_s"] = FM_s_airplane_total[5].item()*lat_non_dim_inv
-
-                if wind_frame:
-                    self._FM[airplane_name]["inviscid"]["CD"]["total"] = FM_w_inv_airplane_total[0].item()*non_dim_inv
-                    self._FM[airplane_name]["inviscid"]["CS"]["total"] = FM_w_inv_airplane_total[1].item()*non_dim_inv
-                    self._FM[airplane_name]["inviscid"]["CL"]["total"] = FM_w_inv_airplane_total[2].item()*non_dim_inv
-                    self._FM[airplane_name]["inviscid"]["Cl_w"]["total"] = FM_w_inv_airplane_total[3].item()*lat_non_dim_inv
-                    self._FM[airplane_name]["inviscid"]["Cm_w"]["total"] = FM_w_inv_airplane_total[4].item()*lon_non_dim_inv
-                    self._FM[airplane_name]["inviscid"]["Cn_w"]["total"] = FM_w_inv_airplane_total[5].item()*lat_non_dim_inv
-
-                    # Store the total viscous force and moment
-                    self._FM[airplane_name]["viscous"]["CD"]["total"] = FM_w_vis_airplane_total[0].item()*non_dim_inv
-                    self._FM[airplane_name]["viscous"]["CS"]["total"] = FM_w_vis_airplane_total[1].item()*non_dim_inv
-                    self._FM[airplane_name]["viscous"]["CL"]["total"] = FM_w_vis_airplane_total[2].item()*non_dim_inv
-                    self._FM[airplane_name]["viscous"]["Cl_w"]["total"] = FM_w_vis_airplane_total[3].item()*lat_non_dim_inv
-                    self._FM[airplane_name]["viscous"]["Cm_w"]["total"] = FM_w_vis_airplane_total[4].item()*lon_non_dim_inv
-                    self._FM[airplane_name]["viscous"]["Cn_w"]["total"] = FM_w_vis_airplane_total[5].item()*lat_non_dim_inv
-
-                    # Determine total force and moment for the airplane
-                    FM_w_airplane_total = FM_w_vis_airplane_total+FM_w_inv_airplane_total
-                    self._FM[airplane_name]["total"]["CD"] = FM_w_airplane_total[0].item()*non_dim_inv
-                    self._FM[airplane_name]["total"]["CS"] = FM_w_airplane_total[1].item()*non_dim_inv
-                    self._FM[airplane_name]["total"]["CL"] = FM_w_airplane_total[2].item()*non_dim_inv
-                    self._FM[airplane_name]["total"]["Cl_w"] = FM_w_airplane_total[3].item()*lat_non_dim_inv
-                    self._FM[airplane_name]["total"]["Cm_w"] = FM_w_airplane_total[4].item()*lon_non_dim_inv
-                    self._FM[airplane_name]["total"]["Cn_w"] = FM_w_airplane_total[5].item()*lat_non_dim_inv
+    def _store_by_segment(self, FM_dict, keys, segment_names, FM):
+        # Stores the forces and moments (or their coefficients) on each segment of an aircraft under the given keys.
+        # FM is arranged as [segment, (inviscid, viscous), (F, M)]
+        for key, inv, vis in zip(keys, FM[:,0].T.tolist(), FM[:,1].T.tolist()):
+            FM_dict["inviscid"][key].update(zip(segment_names, inv))
+            FM_dict["viscous"][key].update(zip(segment_names, vis))
 
-            if dimensional:
-                if body_frame:
-                    self._FM[airplane_name]["inviscid"]["Fx"]["total"] = FM_b_inv_airplane_total[0].item()
-                    self._FM[airplane_name]["inviscid"]["Fy"]["total"] = FM_b_inv_airplane_total[1].item()
-                    self._FM[airplane_name]["inviscid"]["Fz"]["total"] = FM_b_inv_airplane_total[2].item()
-                    self._FM[airplane_name]["inviscid"]["Mx"]["total"] = FM_b_inv_airplane_total[3].item()
-                    self._FM[airplane_name]["inviscid"]["My"]["total"] = FM_b_inv_airplane_total[4].item()
-                    self._FM[airplane_name]["inviscid"]["Mz"]["total"] = FM_b_inv_airplane_total[5].item()
-
-                    # Store the total viscous force and moment
-                    self._FM[airplane_name]["viscous"]["Fx"]["total"] = FM_b_vis_airplane_total[0].item()
-                    self._FM[airplane_name]["viscous"]["Fy"]["total"] = FM_b_vis_airplane_total[1].item()
-                    self._FM[airplane_name]["viscous"]["Fz"]["total"] = FM_b_vis_airplane_total[2].item()
-                    self._FM[airplane_name]["viscous"]["Mx"]["total"] = FM_b_vis_airplane_total[3].item()
-                    self._FM[airplane_name]["viscous"]["My"]["total"] = FM_b_vis_airplane_total[4].item()
-                    self._FM[airplane_name]["viscous"]["Mz"]["total"] = FM_b_vis_airplane_total[5].item()
-
-                    # Determine total force and moment for the airplane
-                    FM_b_airplane_total = FM_b_vis_airplane_total+FM_b_inv_airplane_total
-                    self._FM[airplane_name]["total"]["Fx"] = FM_b_airplane_total[0].item()
-                    self._FM[airplane_name]["total"]["Fy"] = FM_b_airplane_total[1].item()
-                    self._FM[airplane_name]["total"]["Fz"] = FM_b_airplane_total[2].item()
-                    self._FM[airplane_name]["total"]["Mx"] = FM_b_airplane_total[3].item()
-                    self._FM[airplane_name]["total"]["My"] = FM_b_airplane_total[4].item()
-                    self._FM[airplane_name]["total"]["Mz"] = FM_b_airplane_total[5].item()
-
-                if stab_frame:
-                    self._FM[airplane_name]["inviscid"]["Fx_s"]["total"] = FM_s_inv_airplane_total[0].item()
-                    self._FM[airplane_name]["inviscid"]["Fy_s"]["total"] = FM_s_inv_airplane_total[1].item()
-                    self._FM[airplane_name]["inviscid"]["Fz_s"]["total"] = FM_s_inv_airplane_total[2].item()
-                    self._FM[airplane_name]["inviscid"]["Mx_s"]["total"] = FM_s_inv_airplane_total[3].item()
-                    self._FM[airplane_name]["inviscid"]["My_s"]["total"] = FM_s_inv_airplane_total[4].item()
-                    self._FM[airplane_name]["inviscid"]["Mz_s"]["total"] = FM_s_inv_airplane_total[5].item()
-
-                    # Store the total viscous force and moment
-                    self._FM[airplane_name]["viscous"]["Fx_s"]["total"] = FM_s_vis_airplane_total[0].item()
-                    self._FM[airplane_name]["viscous"]["Fy_s"]["total"] = FM_s_vis_airplane_total[1].item()
-                    self._FM[airplane_name]["viscous"]["Fz_s"]["total"] = FM_s_vis_airplane_total[2].item()
-                    self._FM[airplane_name]["viscous"]["Mx_s"]["total"] = FM_s_vis_airplane_total[3].item()
-                    self._FM[airplane_name]["viscous"]["My_s"]["total"] = FM_s_vis_airplane_total[4].item()
-                    self._FM[airplane_name]["viscous"]["Mz_s"]["total"] = FM_s_vis_airplane_total[5].item()
-
-                    # Determine total force and moment for the airplane
-                    FM_s_airplane_total = FM_s_vis_airplane_total+FM_s_inv_airplane_total
-                    self._FM[airplane_name]["total"]["Fx_s"] = FM_s_airplane_total[0].item()
-                    self._FM[airplane_name]["total"]["Fy_s"] = FM_s_airplane_total[1].item()
-                    self._FM[airplane_name]["total"]["Fz_s"] = FM_s_airplane_total[2].item()
-                    self._FM[airplane_name]["total"]["Mx_s"] = FM_s_airplane_total[3].item()
-                    self._FM[airplane_name]["total"]["My_s"] = FM_s_airplane_total[4].item()
-                    self._FM[airplane_name]["total"]["Mz_s"] = FM_s_airplane_total[5].item()
-
-                if wind_frame:
-                    self._FM[airplane_name]["inviscid"]["FD"]["total"] = FM_w_inv_airplane_total[0].item()
-                    self._FM[airplane_name]["inviscid"]["FS"]["total"] = FM_w_inv_airplane_total[1].item()
-                    self._FM[airplane_name]["inviscid"]["FL"]["total"] = FM_w_inv_airplane_total[2].item()
-                    self._FM[airplane_name]["inviscid"]["Mx_w"]["total"] = FM_w_inv_airplane_total[3].item()
-                    self._FM[airplane_name]["inviscid"]["My_w"]["total"] = FM_w_inv_airplane_total[4].item()
-                    self._FM[airplane_name]["inviscid"]["Mz_w"]["total"] = FM_w_inv_airplane_total[5].item()
-
-                    # Store the total viscous force and moment
-                    self._FM[airplane_name]["viscous"]["FD"]["total"] = FM_w_vis_airplane_total[0].item()
-                    self._FM[airplane_name]["viscous"]["FS"]["total"] = FM_w_vis_airplane_total[1].item()
-                    self._FM[airplane_name]["viscous"]["FL"]["total"] = FM_w_vis_airplane_total[2].item()
-                    self._FM[airplane_name]["viscous"]["Mx_w"]["total"] = FM_w_vis_airplane_total[3].item()
-                    self._FM[airplane_name]["viscous"]["My_w"]["total"] = FM_w_vis_airplane_total[4].item()
-                    self._FM[airplane_name]["viscous"]["Mz_w"]["total"] = FM_w_vis_airplane_total[5].item()
-
-                    # Determine total force and moment for the airplane
-                    FM_w_airplane_total = FM_w_vis_airplane_total+FM_w_inv_airplane_total
-                    self._FM[airplane_name]["total"]["FD"] = FM_w_airplane_total[0].item()
-                    self._FM[airplane_name]["total"]["FS"] = FM_w_airplane_total[1].item()
-                    self._FM[airplane_name]["total"]["FL"] = FM_w_airplane_total[2].item()
-                    self._FM[airplane_name]["total"]["Mx_w"] = FM_w_airplane_total[3].item()
-                    self._FM[airplane_name]["total"]["My_w"] = FM_w_airplane_total[4].item()
-                    self._FM[airplane_name]["total"]["Mz_w"] = FM_w_airplane_total[5].item()
 
-        return time.time()-start_time
+    def _store_totals(self, FM_dict, keys, FM_inv, FM_vis):
+        # Stores the total inviscid, viscous, and combined forces and moments (or their coefficients) for an aircraft under the given keys
+        for key, inv, vis, tot in zip(keys, FM_inv.tolist(), FM_vis.tolist(), (FM_inv+FM_vis).tolist()):
+            FM_dict["inviscid"][key]["total"] = inv
+            FM_dict["viscous"][key]["total"] = vis
+            FM_dict["total"][key] = tot
 # ********************************************************************
 
     def solve_forces(self, **kwargs):
@@ -1582,6 +1403,9 @@ class Scene:
         filename : str
             File to export the force and moment results to. Should be .json. If not specified, results will not be exported to a file.
 
+        indent : int, optional
+            Indentation level used when exporting the results to a file. If not specified, the file is written in compact form.
+
         non_dimensional : bool
             If this is set to True, nondimensional coefficients will be included in the results. Defaults to True.
 
@@ -1689,8 +1513,9 @@ class Scene:
         # Output to file
         filename = kwargs.get("filename", None)
         if filename is not None:
+            indent = kwargs.get("indent", None)
             with open(filename, 'w') as json_file_handle:
-                json.dump(self._FM, json_file_handle, indent=4)
+                json_file_handle.write(json.dumps(self._FM, indent=indent))
 
         # Let certain functions know the results are now available
         self._solved = True
@@ -1727,13 +1552,13 @@ class Scene:
         v_wind = self._get_wind(aircraft_position)
 
         # Set state
-        old_position = self._airplanes[aircraft].p_bar
-        old_orient = self._airplanes[aircraft].q
-        self._airplanes[aircraft].set_state(**state, v_wind=v_wind)
-        aircraft_orient = self._airplanes[aircraft].q
+        airplane_object = self._airplanes[aircraft]
+        old_position = airplane_object.p_bar
+        old_orient = airplane_object.q
+        airplane_object.set_state(**state, v_wind=v_wind)
 
-        # If the position has changed, then we need to update the geometry
-        if not np.allclose(old_position, aircraft_position) or not np.allclose(old_orient, aircraft_orient):
+        # If the position or orientation has changed, then we need to update the geometry
+        if (old_position != airplane_object.p_bar).any() or (old_orient != airplane_object.q).any():
             self._perform_geometry_and_atmos_calcs()
 
 
@@ -1787,8 +1612,13 @@ class Scene:
         fig = plt.figure(figsize=plt.figaspect(1.0)*2.0)
         ax = fig.add_subplot(projection='3d')
 
-        # This matters for setting up the plot axis limits
-        first_segment = True
+        # Lower and upper bounds of the points plotted, for setting up the plot axis limits
+        lims_min = np.full(3, np.inf)
+        lims_max = np.full(3, -np.inf)
+
+        # Lines to be drawn together in one collection for each line style
+        outline_lines = []
+        vortex_lines = []
 
         # Kwargs
         show_vortices = kwargs.get("show_vortices", True)
@@ -1800,59 +1630,51 @@ class Scene:
             self._calc_invariant_flow_properties()
 
         # Loop through airplanes
-        for airplane_name, airplane_object in self._airplanes.items():
-
-            # Loop through segments
-            for segment_name, segment_object in airplane_object.wing_segments.items():
+        for (airplane_name, airplane_object), airplane_slice in zip(self._airplanes.items(), self._airplane_slices):
 
-                # Get the outline points and transform to earth-fixed
-                points, cntrl_points = segment_object.get_outline_points()
-                points = airplane_object.p_bar+quat_inv_trans(airplane_object.q, points)
+            # Loop through segments, getting the earth-fixed outline points
+            for segment_name, (points, cntrl_points) in airplane_object.get_outline_points().items():
 
                 # Plot control surfaces
                 if cntrl_points is not None:
-                    cntrl_points = airplane_object.p_bar+quat_inv_trans(airplane_object.q, cntrl_points)
-                    ax.plot(cntrl_points[:,0], cntrl_points[:,1], cntrl_points[:,2], 'k-')
+                    outline_lines.append(cntrl_points)
 
                 # Decide if colors matter and the segment names need to be stored
                 if show_legend:
                     ax.plot(points[:,0], points[:,1], points[:,2], '-', label=airplane_name+segment_name)
                 else:
-                    ax.plot(points[:,0], points[:,1], points[:,2], 'k-')
+                    outline_lines.append(points)
 
                 # Figure out if the segment just added increases any needed axis limits
-                if first_segment:
-                    x_lims = [min(points[:,0].flatten()), max(points[:,0].flatten())]
-                    y_lims = [min(points[:,1].flatten()), max(points[:,1].flatten())]
-                    z_lims = [min(points[:,2].flatten()), max(points[:,2].flatten())]
-                    first_segment = False
-                else:
-                    x_lims = [min(x_lims[0], min(points[:,0].flatten())), max(x_lims[1], max(points[:,0].flatten()))]
-                    y_lims = [min(y_lims[0], min(points[:,1].flatten())), max(y_lims[1], max(points[:,1].flatten()))]
-                    z_lims = [min(z_lims[0], min(points[:,2].flatten())), max(z_lims[1], max(points[:,2].flatten()))]
+                lims_min = np.minimum(lims_min, np.min(points, axis=0))
+                lims_max = np.maximum(lims_max, np.max(points, axis=0))
 
             # Add vortices
             if show_vortices:
-                q = airplane_object.q
-                p = airplane_object.p_bar
 
-                # Loop through wings
-                for wing_slice in airplane_object.wing_slices:
+                # Storage for the six points of each horseshoe vortex, arranged consecutively
+                vortex_points = np.empty((airplane_object.N,6,3))
 
-                    # Declare storage
-                    wing_N = wing_slice.stop-wing_slice.start
-                    vortex_points = np.zeros((wing_N*6,3))
-                    
-                    # Gather and arrange node locations
-                    vortex_points[0:wing_N*6+0:6,:] = p+quat_inv_trans(q, airplane_object.P0_joint[wing_slice])+self._u_trailing_0[wing_slice]*2*airplane_object.l_ref_lon
-                    vortex_points[1:wing_N*6+1:6,:] = p+quat_inv_trans(q, airplane_object.P0_joint[wing_slice])
-                    vortex_points[2:wing_N*6+2:6,:] = p+quat_inv_trans(q, airplane_object.P0[wing_slice])
-                    vortex_points[3:wing_N*6+3:6,:] = p+quat_inv_trans(q, airplane_object.P1[wing_slice])
-                    vortex_points[4:wing_N*6+4:6,:] = p+quat_inv_trans(q, airplane_object.P1_joint[wing_slice])
-                    vortex_points[5:wing_N*6+5:6,:] = p+quat_inv_trans(q, airplane_object.P1_joint[wing_slice])+self._u_trailing_1[wing_slice]*2*airplane_object.l_ref_lon
+                # Transform node locations of the whole airplane to earth-fixed
+                vortex_points[:,1:5] = np.swapaxes(quat_inv_trans(airplane_object.q, np.stack((airplane_object.P0_joint, airplane_object.P0, airplane_object.P1, airplane_object.P1_joint))), 0, 1)
+                vortex_points[:,1:5] += airplane_object.p_bar
 
-                    # Add to plot
-                    ax.plot(vortex_points[:,0], vortex_points[:,1], vortex_points[:,2], 'b--', linewidth=0.2)
+                # Extend the trailing vortices from the joints
+                trailing_length = 2*airplane_object.l_ref_lon
+                np.multiply(self._u_trailing_0[airplane_slice], trailing_length, out=vortex_points[:,0])
+                vortex_points[:,0] += vortex_points[:,1]
+                np.multiply(self._u_trailing_1[airplane_slice], trailing_length, out=vortex_points[:,5])
+                vortex_points[:,5] += vortex_points[:,4]
+
+                # Add to plot, one line for each wing
+                for wing_slice in airplane_object.wing_slices:
+                    vortex_lines.append(vortex_points[wing_slice].reshape((-1,3)))
+
+        # Draw the collected lines
+        if outline_lines:
+            ax.add_collection3d(Line3DCollection(outline_lines, colors='k', linestyles='-'))
+        if vortex_lines:
+            ax.add_collection3d(Line3DCollection(vortex_lines, colors='b', linestyles='--', linewidths=0.2))
 
         # Add legend
         if show_legend:
@@ -1864,6 +1686,7 @@ class Scene:
         ax.set_zlabel('z')
 
         # Find out which axis has the widest limits
+        x_lims, y_lims, z_lims = np.stack((lims_min, lims_max), axis=1).tolist()
         x_diff = x_lims[1]-x_lims[0]
         y_diff = y_lims[1]-y_lims[0]
         z_diff = z_lims[1]-z_lims[0]
@@ -1914,8 +1737,9 @@ class Scene:
             and not save.
         """
 
-        # This matters for setting up the plot axis limits
-        first_segment = True
+        # Lower and upper bounds of the points plotted, for setting up the plot axis limits
+        lims_min = np.full(2, np.inf)
+        lims_max = np.full(2, -np.inf)
 
         # Kwargs
         file_tag = kwargs.get("file_tag", None)
@@ -1944,19 +1768,15 @@ class Scene:
                     plt.plot(cntrl_points[:,1], cntrl_points[:,0], 'k-')
 
                 # Figure out if the segment just added increases any needed axis limits
-                if first_segment:
-                    x_lims = [min(points[:,0].flatten()), max(points[:,0].flatten())]
-                    y_lims = [min(points[:,1].flatten()), max(points[:,1].flatten())]
-                    first_segment = False
-                else:
-                    x_lims = [min(x_lims[0], min(points[:,0].flatten())), max(x_lims[1], max(points[:,0].flatten()))]
-                    y_lims = [min(y_lims[0], min(points[:,1].flatten())), max(y_lims[1], max(points[:,1].flatten()))]
+                lims_min = np.minimum(lims_min, np.min(points[:,:2], axis=0))
+                lims_max = np.maximum(lims_max, np.max(points[:,:2], axis=0))
 
             # Set axis labels
             plt.xlabel('x')
             plt.ylabel('y')
 
             # Find out which axis has the widest limits
+            x_lims, y_lims = np.stack((lims_min, lims_max), axis=1).tolist()
             x_diff = x_lims[1]-x_lims[0]
             y_diff = y_lims[1]-y_lims[0]
             max_diff = max([x_diff, y_diff])
@@ -2019,22 +1839,26 @@ class Scene:
         # Specify the aircraft
         aircraft_names = self._get_aircraft(**kwargs)
 
+        # The perturbed solves are all central differences about the current state, so no
+        # unperturbed solution needs to be found or shared between the three sets of derivatives
         for aircraft_name in aircraft_names:
             derivs[aircraft_name] = {}
+            aircraft_kwargs = dict(kwargs, aircraft=aircraft_name)
+
             # Determine stability derivatives
-            derivs[aircraft_name]["stability"] = self.stability_derivatives(aircraft=aircraft_name, **kwargs)[aircraft_name]
+            derivs[aircraft_name]["stability"] = self.stability_derivatives(**aircraft_kwargs)[aircraft_name]
         
             # Determine damping derivatives
-            derivs[aircraft_name]["damping"] = self.damping_derivatives(aircraft=aircraft_name, **kwargs)[aircraft_name]
+            derivs[aircraft_name]["damping"] = self.damping_derivatives(**aircraft_kwargs)[aircraft_name]
 
             # Determine control derivatives
-            derivs[aircraft_name]["control"] = self.control_derivatives(aircraft=aircraft_name, **kwargs)[aircraft_name]
+            derivs[aircraft_name]["control"] = self.control_derivatives(**aircraft_kwargs)[aircraft_name]
 
         # Export to file
         filename = kwargs.get("filename", None)
         if filename is not None:
             with open(filename, 'w') as output_handle:
-                json.dump(derivs, output_handle, indent=4)
+                output_handle.write(json.dumps(derivs, indent=4))
 
         return derivs
 
@@ -2085,72 +1909,38 @@ class Scene:
 
             # Perturb forward in alpha
             self._airplanes[aircraft_name].set_aerodynamic_state(alpha=alpha_0+dtheta)
-            self.solve_forces(dimensional=False, **kwargs)
+            self._solve_perturbed_forces(**kwargs)
             FM_dalpha_fwd = self._FM
 
             # Perturb backward in alpha
             self._airplanes[aircraft_name].set_aerodynamic_state(alpha=alpha_0-dtheta)
-            self.solve_forces(dimensional=False, **kwargs)
+            self._solve_perturbed_forces(**kwargs)
             FM_dalpha_bwd = self._FM
 
             # Perturb forward in beta
             self._airplanes[aircraft_name].set_aerodynamic_state(alpha=alpha_0, beta=beta_0+dtheta) # We have to reset alpha on this one
-            self.solve_forces(dimensional=False, **kwargs)
+            self._solve_perturbed_forces(**kwargs)
             FM_dbeta_fwd = self._FM
 
             # Perturb backward in beta
             self._airplanes[aircraft_name].set_aerodynamic_state(beta=beta_0-dtheta)
-            self.solve_forces(dimensional=False, **kwargs)
+            self._solve_perturbed_forces(**kwargs)
             FM_dbeta_bwd = self._FM
 
             diff = 1/(2*np.radians(dtheta)) # The derivative is in radians
 
-            if body_frame:
-                derivs[aircraft_name]["Cx,a"] = (FM_dalpha_fwd[aircraft_name]["total"]["Cx"]-FM_dalpha_bwd[aircraft_name]["total"]["Cx"])*diff
-                derivs[aircraft_name]["Cy,a"] = (FM_dalpha_fwd[aircraft_name]["total"]["Cy"]-FM_dalpha_bwd[aircraft_name]["total"]["Cy"])*diff
-                derivs[aircraft_name]["Cz,a"] = (FM_dalpha_fwd[aircraft_name]["total"]["Cz"]-FM_dalpha_bwd[aircraft_name]["total"]["Cz"])*diff
-                derivs[aircraft_name]["Cl,a"] = (FM_dalpha_fwd[aircraft_name]["total"]["Cl"]-FM_dalpha_bwd[aircraft_name]["total"]["Cl"])*diff
-                derivs[aircraft_name]["Cm,a"] = (FM_dalpha_fwd[aircraft_name]["total"]["Cm"]-FM_dalpha_bwd[aircraft_name]["total"]["Cm"])*diff
-                derivs[aircraft_name]["Cn,a"] = (FM_dalpha_fwd[aircraft_name]["total"]["Cn"]-FM_dalpha_bwd[aircraft_name]["total"]["Cn"])*diff
-
-                derivs[aircraft_name]["Cx,b"] = (FM_dbeta_fwd[aircraft_name]["total"]["Cx"]-FM_dbeta_bwd[aircraft_name]["total"]["Cx"])*diff
-                derivs[aircraft_name]["Cy,b"] = (FM_dbeta_fwd[aircraft_name]["total"]["Cy"]-FM_dbeta_bwd[aircraft_name]["total"]["Cy"])*diff
-                derivs[aircraft_name]["Cz,b"] = (FM_dbeta_fwd[aircraft_name]["total"]["Cz"]-FM_dbeta_bwd[aircraft_name]["total"]["Cz"])*diff
-                derivs[aircraft_name]["Cl,b"] = (FM_dbeta_fwd[aircraft_name]["total"]["Cl"]-FM_dbeta_bwd[aircraft_name]["total"]["Cl"])*diff
-                derivs[aircraft_name]["Cm,b"] = (FM_dbeta_fwd[aircraft_name]["total"]["Cm"]-FM_dbeta_bwd[aircraft_name]["total"]["Cm"])*diff
-                derivs[aircraft_name]["Cn,b"] = (FM_dbeta_fwd[aircraft_name]["total"]["Cn"]-FM_dbeta_bwd[aircraft_name]["total"]["Cn"])*diff
-
-            if stab_frame:
-                derivs[aircraft_name]["Cx_s,a"] = (FM_dalpha_fwd[aircraft_name]["total"]["Cx_s"]-FM_dalpha_bwd[aircraft_name]["total"]["Cx_s"])*diff
-                derivs[aircraft_name]["Cy_s,a"] = (FM_dalpha_fwd[aircraft_name]["total"]["Cy_s"]-FM_dalpha_bwd[aircraft_name]["total"]["Cy_s"])*diff
-                derivs[aircraft_name]["Cz_s,a"] = (FM_dalpha_fwd[aircraft_name]["total"]["Cz_s"]-FM_dalpha_bwd[aircraft_name]["total"]["Cz_s"])*diff
-                derivs[aircraft_name]["Cl_s,a"] = (FM_dalpha_fwd[aircraft_name]["total"]["Cl_s"]-FM_dalpha_bwd[aircraft_name]["total"]["Cl_s"])*diff
-                derivs[aircraft_name]["Cm_s,a"] = (FM_dalpha_fwd[aircraft_name]["total"]["Cm_s"]-FM_dalpha_bwd[aircraft_name]["total"]["Cm_s"])*diff
-                derivs[aircraft_name]["Cn_s,a"] = (FM_dalpha_fwd[aircraft_name]["total"]["Cn_s"]-FM_dalpha_bwd[aircraft_name]["total"]["Cn_s"])*diff
-
-                derivs[aircraft_name]["Cx_s,b"] = (FM_dbeta_fwd[aircraft_name]["total"]["Cx_s"]-FM_dbeta_bwd[aircraft_name]["total"]["Cx_s"])*diff
-                derivs[aircraft_name]["Cy_s,b"] = (FM_dbeta_fwd[aircraft_name]["total"]["Cy_s"]-FM_dbeta_bwd[aircraft_name]["total"]["Cy_s"])*diff
-                derivs[aircraft_name]["Cz_s,b"] = (FM_dbeta_fwd[aircraft_name]["total"]["Cz_s"]-FM_dbeta_bwd[aircraft_name]["total"]["Cz_s"])*diff
-                derivs[aircraft_name]["Cl_s,b"] = (FM_dbeta_fwd[aircraft_name]["total"]["Cl_s"]-FM_dbeta_bwd[aircraft_name]["total"]["Cl_s"])*diff
-                derivs[aircraft_name]["Cm_s,b"] = (FM_dbeta_fwd[aircraft_name]["total"]["Cm_s"]-FM_dbeta_bwd[aircraft_name]["total"]["Cm_s"])*diff
-                derivs[aircraft_name]["Cn_s,b"] = (FM_dbeta_fwd[aircraft_name]["total"]["Cn_s"]-FM_dbeta_bwd[aircraft_name]["total"]["Cn_s"])*diff
-
+            # Difference the totals for each requested frame
+            FM_totals = (("a", FM_dalpha_fwd[aircraft_name]["total"], FM_dalpha_bwd[aircraft_name]["total"]),
+                         ("b", FM_dbeta_fwd[aircraft_name]["total"], FM_dbeta_bwd[aircraft_name]["total"]))
+            for frame, output in zip(("body", "stab", "wind"), (body_frame, stab_frame, wind_frame)):
+                if not output:
+                    continue
+                for pert, FM_fwd, FM_bwd in FM_totals:
+                    for key in _COEF_KEYS[frame]:
+                        derivs[aircraft_name][key+","+pert] = (FM_fwd[key]-FM_bwd[key])*diff
+
+            # Calculate static margin
             if wind_frame:
-                derivs[aircraft_name]["CL,a"] = (FM_dalpha_fwd[aircraft_name]["total"]["CL"]-FM_dalpha_bwd[aircraft_name]["total"]["CL"])*diff
-                derivs[aircraft_name]["CD,a"] = (FM_dalpha_fwd[aircraft_name]["total"]["CD"]-FM_dalpha_bwd[aircraft_name]["total"]["CD"])*diff
-                derivs[aircraft_name]["CS,a"] = (FM_dalpha_fwd[aircraft_name]["total"]["CS"]-FM_dalpha_bwd[aircraft_name]["total"]["CS"])*diff
-                derivs[aircraft_name]["Cl_w,a"] = (FM_dalpha_fwd[aircraft_name]["total"]["Cl_w"]-FM_dalpha_bwd[aircraft_name]["total"]["Cl_w"])*diff
-                derivs[aircraft_name]["Cm_w,a"] = (FM_dalpha_fwd[aircraft_name]["total"]["Cm_w"]-FM_dalpha_bwd[aircraft_name]["total"]["Cm_w"])*diff
-                derivs[aircraft_name]["Cn_w,a"] = (FM_dalpha_fwd[aircraft_name]["total"]["Cn_w"]-FM_dalpha_bwd[aircraft_name]["total"]["Cn_w"])*diff
-
-                derivs[aircraft_name]["CL,b"] = (FM_dbeta_fwd[aircraft_name]["total"]["CL"]-FM_dbeta_bwd[aircraft_name]["total"]["CL"])*diff
-                derivs[aircraft_name]["CD,b"] = (FM_dbeta_fwd[aircraft_name]["total"]["CD"]-FM_dbeta_bwd[aircraft_name]["total"]["CD"])*diff
-                derivs[aircraft_name]["CS,b"] = (FM_dbeta_fwd[aircraft_name]["total"]["CS"]-FM_dbeta_bwd[aircraft_name]["total"]["CS"])*diff
-                derivs[aircraft_name]["Cl_w,b"] = (FM_dbeta_fwd[aircraft_name]["total"]["Cl_w"]-FM_dbeta_bwd[aircraft_name]["total"]["Cl_w"])*diff
-                derivs[aircraft_name]["Cm_w,b"] = (FM_dbeta_fwd[aircraft_name]["total"]["Cm_w"]-FM_dbeta_bwd[aircraft_name]["total"]["Cm_w"])*diff
-                derivs[aircraft_name]["Cn_w,b"] = (FM_dbeta_fwd[aircraft_name]["total"]["Cn_w"]-FM_dbeta_bwd[aircraft_name]["total"]["Cn_w"])*diff
-
-                # Calculate static margin
                 derivs[aircraft_name]["%_static_margin"] = -derivs[aircraft_name]["Cm_w,a"]/derivs[aircraft_name]["CL,a"]*100.0
         
             # Reset aerodynamic state
@@ -2213,56 +2003,23 @@ class Scene:
             omega_0 = aircraft_object.w
             frame = aircraft_object.angular_rate_frame
 
-            # Determine preturbations
-            p_pert = np.array([dtheta_dot, 0.0, 0.0])
-            q_pert = np.array([0.0, dtheta_dot, 0.0])
-            r_pert = np.array([0.0, 0.0, dtheta_dot])
+            # Determine perturbations to the roll, pitch, and yaw rates (one per row)
+            rate_perts = np.identity(3)*dtheta_dot
 
             if frame == "stab":
-                p_pert = quat_inv_trans(aircraft_object.q_to_stab, p_pert)
-                q_pert = quat_inv_trans(aircraft_object.q_to_stab, q_pert)
-                r_pert = quat_inv_trans(aircraft_object.q_to_stab, r_pert)
+                rate_perts = quat_inv_trans(aircraft_object.q_to_stab, rate_perts)
 
             elif frame == "wind":
-                p_pert = quat_inv_trans(aircraft_object.q_to_wind, p_pert)
-                q_pert = quat_inv_trans(aircraft_object.q_to_wind, q_pert)
-                r_pert = quat_inv_trans(aircraft_object.q_to_wind, r_pert)
-
-            # Perturb forward in roll rate
-            omega_pert_p_fwd = omega_0+p_pert
-            aircraft_object.w = omega_pert_p_fwd
-            self.solve_forces(dimensional=False, **kwargs)
-            FM_dp_fwd = self._FM
-
-            # Perturb backward in roll rate
-            omega_pert_p_bwd = omega_0-p_pert
-            aircraft_object.w = omega_pert_p_bwd
-            self.solve_forces(dimensional=False, **kwargs)
-            FM_dp_bwd = self._FM
-
-            # Perturb forward in pitch rate
-            omega_pert_q_fwd = omega_0+q_pert
-            aircraft_object.w = omega_pert_q_fwd
-            self.solve_forces(dimensional=False, **kwargs)
-            FM_dq_fwd = self._FM
-
-            # Perturb backward in pitch rate
-            omega_pert_q_bwd = omega_0-q_pert
-            aircraft_object.w = omega_pert_q_bwd
-            self.solve_forces(dimensional=False, **kwargs)
-            FM_dq_bwd = self._FM
-
-            # Perturb forward in yaw rate
-            omega_pert_r_fwd = omega_0+r_pert
-            aircraft_object.w = omega_pert_r_fwd
-            self.solve_forces(dimensional=False, **kwargs)
-            FM_dr_fwd = self._FM
-
-            # Perturb backward in yaw rate
-            omega_pert_r_bwd = omega_0-r_pert
-            aircraft_object.w = omega_pert_r_bwd
-            self.solve_forces(dimensional=False, **kwargs)
-            FM_dr_bwd = self._FM
+                rate_perts = quat_inv_trans(aircraft_object.q_to_wind, rate_perts)
+
+            # Perturbed angular rates, ordered forward and backward in roll, pitch, and yaw rate
+            omega_perts = omega_0+np.stack((rate_perts, -rate_perts), axis=1).reshape((6,3))
+
+            # Solve at each perturbed angular rate
+            FM_perts = []
+            for omega_pert in omega_perts:
+                aircraft_object.w = omega_pert
+                FM_perts.append(self._solve_perturbed_forces(**kwargs))
 
             # Reset state
             aircraft_object.w = omega_0
@@ -2273,72 +2030,17 @@ class Scene:
             lat_non_dim = 2*vel_0/b
             lon_non_dim = 2*vel_0/c
             dx_inv = 1/(2*dtheta_dot)
-
-            if body_frame:
-                derivs[aircraft_name]["Cx,pbar"] = (FM_dp_fwd[aircraft_name]["total"]["Cx"]-FM_dp_bwd[aircraft_name]["total"]["Cx"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cy,pbar"] = (FM_dp_fwd[aircraft_name]["total"]["Cy"]-FM_dp_bwd[aircraft_name]["total"]["Cy"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cz,pbar"] = (FM_dp_fwd[aircraft_name]["total"]["Cz"]-FM_dp_bwd[aircraft_name]["total"]["Cz"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cl,pbar"] = (FM_dp_fwd[aircraft_name]["total"]["Cl"]-FM_dp_bwd[aircraft_name]["total"]["Cl"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cm,pbar"] = (FM_dp_fwd[aircraft_name]["total"]["Cm"]-FM_dp_bwd[aircraft_name]["total"]["Cm"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cn,pbar"] = (FM_dp_fwd[aircraft_name]["total"]["Cn"]-FM_dp_bwd[aircraft_name]["total"]["Cn"])*dx_inv*lat_non_dim
-
-                derivs[aircraft_name]["Cx,qbar"] = (FM_dq_fwd[aircraft_name]["total"]["Cx"]-FM_dq_bwd[aircraft_name]["total"]["Cx"])*dx_inv*lon_non_dim
-                derivs[aircraft_name]["Cy,qbar"] = (FM_dq_fwd[aircraft_name]["total"]["Cy"]-FM_dq_bwd[aircraft_name]["total"]["Cy"])*dx_inv*lon_non_dim
-                derivs[aircraft_name]["Cz,qbar"] = (FM_dq_fwd[aircraft_name]["total"]["Cz"]-FM_dq_bwd[aircraft_name]["total"]["Cz"])*dx_inv*lon_non_dim
-                derivs[aircraft_name]["Cl,qbar"] = (FM_dq_fwd[aircraft_name]["total"]["Cl"]-FM_dq_bwd[aircraft_name]["total"]["Cl"])*dx_inv*lon_non_dim
-                derivs[aircraft_name]["Cm,qbar"] = (FM_dq_fwd[aircraft_name]["total"]["Cm"]-FM_dq_bwd[aircraft_name]["total"]["Cm"])*dx_inv*lon_non_dim
-                derivs[aircraft_name]["Cn,qbar"] = (FM_dq_fwd[aircraft_name]["total"]["Cn"]-FM_dq_bwd[aircraft_name]["total"]["Cn"])*dx_inv*lon_non_dim
-
-                derivs[aircraft_name]["Cx,rbar"] = (FM_dr_fwd[aircraft_name]["total"]["Cx"]-FM_dr_bwd[aircraft_name]["total"]["Cx"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cy,rbar"] = (FM_dr_fwd[aircraft_name]["total"]["Cy"]-FM_dr_bwd[aircraft_name]["total"]["Cy"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cz,rbar"] = (FM_dr_fwd[aircraft_name]["total"]["Cz"]-FM_dr_bwd[aircraft_name]["total"]["Cz"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cl,rbar"] = (FM_dr_fwd[aircraft_name]["total"]["Cl"]-FM_dr_bwd[aircraft_name]["total"]["Cl"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cm,rbar"] = (FM_dr_fwd[aircraft_name]["total"]["Cm"]-FM_dr_bwd[aircraft_name]["total"]["Cm"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cn,rbar"] = (FM_dr_fwd[aircraft_name]["total"]["Cn"]-FM_dr_bwd[aircraft_name]["total"]["Cn"])*dx_inv*lat_non_dim
-
-            if stab_frame:
-                derivs[aircraft_name]["Cx_s,pbar"] = (FM_dp_fwd[aircraft_name]["total"]["Cx_s"]-FM_dp_bwd[aircraft_name]["total"]["Cx_s"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cy_s,pbar"] = (FM_dp_fwd[aircraft_name]["total"]["Cy_s"]-FM_dp_bwd[aircraft_name]["total"]["Cy_s"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cz_s,pbar"] = (FM_dp_fwd[aircraft_name]["total"]["Cz_s"]-FM_dp_bwd[aircraft_name]["total"]["Cz_s"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cl_s,pbar"] = (FM_dp_fwd[aircraft_name]["total"]["Cl_s"]-FM_dp_bwd[aircraft_name]["total"]["Cl_s"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cm_s,pbar"] = (FM_dp_fwd[aircraft_name]["total"]["Cm_s"]-FM_dp_bwd[aircraft_name]["total"]["Cm_s"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cn_s,pbar"] = (FM_dp_fwd[aircraft_name]["total"]["Cn_s"]-FM_dp_bwd[aircraft_name]["total"]["Cn_s"])*dx_inv*lat_non_dim
-
-                derivs[aircraft_name]["Cx_s,qbar"] = (FM_dq_fwd[aircraft_name]["total"]["Cx_s"]-FM_dq_bwd[aircraft_name]["total"]["Cx_s"])*dx_inv*lon_non_dim
-                derivs[aircraft_name]["Cy_s,qbar"] = (FM_dq_fwd[aircraft_name]["total"]["Cy_s"]-FM_dq_bwd[aircraft_name]["total"]["Cy_s"])*dx_inv*lon_non_dim
-                derivs[aircraft_name]["Cz_s,qbar"] = (FM_dq_fwd[aircraft_name]["total"]["Cz_s"]-FM_dq_bwd[aircraft_name]["total"]["Cz_s"])*dx_inv*lon_non_dim
-                derivs[aircraft_name]["Cl_s,qbar"] = (FM_dq_fwd[aircraft_name]["total"]["Cl_s"]-FM_dq_bwd[aircraft_name]["total"]["Cl_s"])*dx_inv*lon_non_dim
-                derivs[aircraft_name]["Cm_s,qbar"] = (FM_dq_fwd[aircraft_name]["total"]["Cm_s"]-FM_dq_bwd[aircraft_name]["total"]["Cm_s"])*dx_inv*lon_non_dim
-                derivs[aircraft_name]["Cn_s,qbar"] = (FM_dq_fwd[aircraft_name]["total"]["Cn_s"]-FM_dq_bwd[aircraft_name]["total"]["Cn_s"])*dx_inv*lon_non_dim
-
-                derivs[aircraft_name]["Cx_s,rbar"] = (FM_dr_fwd[aircraft_name]["total"]["Cx_s"]-FM_dr_bwd[aircraft_name]["total"]["Cx_s"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cy_s,rbar"] = (FM_dr_fwd[aircraft_name]["total"]["Cy_s"]-FM_dr_bwd[aircraft_name]["total"]["Cy_s"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cz_s,rbar"] = (FM_dr_fwd[aircraft_name]["total"]["Cz_s"]-FM_dr_bwd[aircraft_name]["total"]["Cz_s"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cl_s,rbar"] = (FM_dr_fwd[aircraft_name]["total"]["Cl_s"]-FM_dr_bwd[aircraft_name]["total"]["Cl_s"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cm_s,rbar"] = (FM_dr_fwd[aircraft_name]["total"]["Cm_s"]-FM_dr_bwd[aircraft_name]["total"]["Cm_s"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cn_s,rbar"] = (FM_dr_fwd[aircraft_name]["total"]["Cn_s"]-FM_dr_bwd[aircraft_name]["total"]["Cn_s"])*dx_inv*lat_non_dim
-
-            if wind_frame:
-                derivs[aircraft_name]["CL,qbar"] = (FM_dq_fwd[aircraft_name]["total"]["CL"]-FM_dq_bwd[aircraft_name]["total"]["CL"])*dx_inv*lon_non_dim
-                derivs[aircraft_name]["CD,qbar"] = (FM_dq_fwd[aircraft_name]["total"]["CD"]-FM_dq_bwd[aircraft_name]["total"]["CD"])*dx_inv*lon_non_dim
-                derivs[aircraft_name]["CS,qbar"] = (FM_dq_fwd[aircraft_name]["total"]["CS"]-FM_dq_bwd[aircraft_name]["total"]["CS"])*dx_inv*lon_non_dim
-                derivs[aircraft_name]["Cl_w,pbar"] = (FM_dp_fwd[aircraft_name]["total"]["Cl_w"]-FM_dp_bwd[aircraft_name]["total"]["Cl_w"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cm_w,pbar"] = (FM_dp_fwd[aircraft_name]["total"]["Cm_w"]-FM_dp_bwd[aircraft_name]["total"]["Cm_w"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cn_w,pbar"] = (FM_dp_fwd[aircraft_name]["total"]["Cn_w"]-FM_dp_bwd[aircraft_name]["total"]["Cn_w"])*dx_inv*lat_non_dim
-
-                derivs[aircraft_name]["CL,pbar"] = (FM_dp_fwd[aircraft_name]["total"]["CL"]-FM_dp_bwd[aircraft_name]["total"]["CL"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["CD,pbar"] = (FM_dp_fwd[aircraft_name]["total"]["CD"]-FM_dp_bwd[aircraft_name]["total"]["CD"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["CS,pbar"] = (FM_dp_fwd[aircraft_name]["total"]["CS"]-FM_dp_bwd[aircraft_name]["total"]["CS"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cl_w,qbar"] = (FM_dq_fwd[aircraft_name]["total"]["Cl_w"]-FM_dq_bwd[aircraft_name]["total"]["Cl_w"])*dx_inv*lon_non_dim
-                derivs[aircraft_name]["Cm_w,qbar"] = (FM_dq_fwd[aircraft_name]["total"]["Cm_w"]-FM_dq_bwd[aircraft_name]["total"]["Cm_w"])*dx_inv*lon_non_dim
-                derivs[aircraft_name]["Cn_w,qbar"] = (FM_dq_fwd[aircraft_name]["total"]["Cn_w"]-FM_dq_bwd[aircraft_name]["total"]["Cn_w"])*dx_inv*lon_non_dim
-
-                derivs[aircraft_name]["CL,rbar"] = (FM_dr_fwd[aircraft_name]["total"]["CL"]-FM_dr_bwd[aircraft_name]["total"]["CL"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["CD,rbar"] = (FM_dr_fwd[aircraft_name]["total"]["CD"]-FM_dr_bwd[aircraft_name]["total"]["CD"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["CS,rbar"] = (FM_dr_fwd[aircraft_name]["total"]["CS"]-FM_dr_bwd[aircraft_name]["total"]["CS"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cl_w,rbar"] = (FM_dr_fwd[aircraft_name]["total"]["Cl_w"]-FM_dr_bwd[aircraft_name]["total"]["Cl_w"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cm_w,rbar"] = (FM_dr_fwd[aircraft_name]["total"]["Cm_w"]-FM_dr_bwd[aircraft_name]["total"]["Cm_w"])*dx_inv*lat_non_dim
-                derivs[aircraft_name]["Cn_w,rbar"] = (FM_dr_fwd[aircraft_name]["total"]["Cn_w"]-FM_dr_bwd[aircraft_name]["total"]["Cn_w"])*dx_inv*lat_non_dim
+            rate_scales = dx_inv*np.array([lat_non_dim, lon_non_dim, lat_non_dim])
+
+            # Difference the totals for each requested frame, one row per angular rate
+            for frame, output in zip(("body", "stab", "wind"), (body_frame, stab_frame, wind_frame)):
+                if not output:
+                    continue
+                keys = _COEF_KEYS[frame]
+                FM_totals = np.array([[FM_pert[aircraft_name]["total"][key] for key in keys] for FM_pert in FM_perts])
+                d_coefs = ((FM_totals[0::2]-FM_totals[1::2])*rate_scales[:,np.newaxis]).tolist()
+                for rate, d_coef in zip(("pbar", "qbar", "rbar"), d_coefs):
+                    derivs[aircraft_name].update(zip([key+","+rate for key in keys], d_coef))
 
         return derivs
 
@@ -2380,6 +2082,9 @@ class Scene:
         # Determine output frames
         body_frame, stab_frame, wind_frame = self._get_frames(**kwargs)
 
+        # Coefficients to differentiate
+        coef_keys = [key for frame, output in zip(("body", "stab", "wind"), (body_frame, stab_frame, wind_frame)) if output for key in _COEF_KEYS[frame]]
+
         # Get finite step
         dtheta = kwargs.get('dtheta', 0.5)
 
@@ -2389,7 +2094,9 @@ class Scene:
             curr_control_state = copy.deepcopy(aircraft_object.current_control_state)
             pert_control_state = copy.deepcopy(curr_control_state)
 
-            # Loop through available controls
+            # Solve with each available control perturbed forward and backward in turn
+            FM_fwds = []
+            FM_bwds = []
             for control_name in aircraft_object.control_names:
 
                 curr_control_val = curr_control_state.get(control_name, 0.0)
@@ -2397,44 +2104,27 @@ class Scene:
                 #Perturb forward
                 pert_control_state[control_name] = curr_control_val + dtheta
                 aircraft_object.set_control_state(control_state=pert_control_state)
-                FM_fwd = self.solve_forces(dimensional=False, **kwargs)
+                FM_fwds.append(self._solve_perturbed_forces(**kwargs)[aircraft_name]["total"])
 
                 #Perturb backward
                 pert_control_state[control_name] = curr_control_val - dtheta
                 aircraft_object.set_control_state(control_state=pert_control_state)
-                FM_bwd = self.solve_forces(dimensional=False, **kwargs)
+                FM_bwds.append(self._solve_perturbed_forces(**kwargs)[aircraft_name]["total"])
 
-                # Reset state
+                # Reset the perturbed control for the next one
                 pert_control_state[control_name] = curr_control_val
-                aircraft_object.set_control_state(control_state=pert_control_state)
-                self._solved = False
-
-                # Calculate derivatives
-                diff = 2*np.radians(dtheta)
-
-                if body_frame:
-                    derivs[aircraft_name]["Cx,d"+control_name] = (FM_fwd[aircraft_name]["total"]["Cx"]-FM_bwd[aircraft_name]["total"]["Cx"])/diff
-                    derivs[aircraft_name]["Cy,d"+control_name] = (FM_fwd[aircraft_name]["total"]["Cy"]-FM_bwd[aircraft_name]["total"]["Cy"])/diff
-                    derivs[aircraft_name]["Cz,d"+control_name] = (FM_fwd[aircraft_name]["total"]["Cz"]-FM_bwd[aircraft_name]["total"]["Cz"])/diff
-                    derivs[aircraft_name]["Cl,d"+control_name] = (FM_fwd[aircraft_name]["total"]["Cl"]-FM_bwd[aircraft_name]["total"]["Cl"])/diff
-                    derivs[aircraft_name]["Cm,d"+control_name] = (FM_fwd[aircraft_name]["total"]["Cm"]-FM_bwd[aircraft_name]["total"]["Cm"])/diff
-                    derivs[aircraft_name]["Cn,d"+control_name] = (FM_fwd[aircraft_name]["total"]["Cn"]-FM_bwd[aircraft_name]["total"]["Cn"])/diff
-
-                if stab_frame:
-                    derivs[aircraft_name]["Cx_s,d"+control_name] = (FM_fwd[aircraft_name]["total"]["Cx_s"]-FM_bwd[aircraft_name]["total"]["Cx_s"])/diff
-                    derivs[aircraft_name]["Cy_s,d"+control_name] = (FM_fwd[aircraft_name]["total"]["Cy_s"]-FM_bwd[aircraft_name]["total"]["Cy_s"])/diff
-                    derivs[aircraft_name]["Cz_s,d"+control_name] = (FM_fwd[aircraft_name]["total"]["Cz_s"]-FM_bwd[aircraft_name]["total"]["Cz_s"])/diff
-                    derivs[aircraft_name]["Cl_s,d"+control_name] = (FM_fwd[aircraft_name]["total"]["Cl_s"]-FM_bwd[aircraft_name]["total"]["Cl_s"])/diff
-                    derivs[aircraft_name]["Cm_s,d"+control_name] = (FM_fwd[aircraft_name]["total"]["Cm_s"]-FM_bwd[aircraft_name]["total"]["Cm_s"])/diff
-                    derivs[aircraft_name]["Cn_s,d"+control_name] = (FM_fwd[aircraft_name]["total"]["Cn_s"]-FM_bwd[aircraft_name]["total"]["Cn_s"])/diff
-
-                if wind_frame:
-                    derivs[aircraft_name]["CL,d"+control_name] = (FM_fwd[aircraft_name]["total"]["CL"]-FM_bwd[aircraft_name]["total"]["CL"])/diff
-                    derivs[aircraft_name]["CD,d"+control_name] = (FM_fwd[aircraft_name]["total"]["CD"]-FM_bwd[aircraft_name]["total"]["CD"])/diff
-                    derivs[aircraft_name]["CS,d"+control_name] = (FM_fwd[aircraft_name]["total"]["CS"]-FM_bwd[aircraft_name]["total"]["CS"])/diff
-                    derivs[aircraft_name]["Cl_w,d"+control_name] = (FM_fwd[aircraft_name]["total"]["Cl_w"]-FM_bwd[aircraft_name]["total"]["Cl_w"])/diff
-                    derivs[aircraft_name]["Cm_w,d"+control_name] = (FM_fwd[aircraft_name]["total"]["Cm_w"]-FM_bwd[aircraft_name]["total"]["Cm_w"])/diff
-                    derivs[aircraft_name]["Cn_w,d"+control_name] = (FM_fwd[aircraft_name]["total"]["Cn_w"]-FM_bwd[aircraft_name]["total"]["Cn_w"])/diff
+
+            # Reset state
+            aircraft_object.set_control_state(control_state=curr_control_state)
+            self._solved = False
+
+            # Calculate derivatives, one row per control
+            diff = 2*np.radians(dtheta)
+            FM_fwd = np.array([[FM[key] for key in coef_keys] for FM in FM_fwds])
+            FM_bwd = np.array([[FM[key] for key in coef_keys] for FM in FM_bwds])
+            d_coefs = ((FM_fwd-FM_bwd)/diff).tolist()
+            for control_name, d_coef in zip(aircraft_object.control_names, d_coefs):
+                derivs[aircraft_name].update(zip([key+",d"+control_name for key in coef_keys], d_coef))
 
         return derivs
 
@@ -2548,7 +2238,7 @@ class Scene:
             if variable == "position":
                 self._perform_geometry_and_atmos_calcs()
             self.solve_forces(nondimensional=False, **kwargs)
-            FM_fwd = copy.deepcopy(self._FM)
+            FM_fwd = self._FM[aircraft_name]["total"]
 
             # Backward
             pert_state[variable][index] -= 2.0*perturbation
@@ -2556,7 +2246,7 @@ class Scene:
             if variable == "position":
                 self._perform_geometry_and_atmos_calcs()
             self.solve_forces(nondimensional=False, **kwargs)
-            FM_bwd = copy.deepcopy(self._FM)
+            FM_bwd = self._FM[aircraft_name]["total"]
 
         # Quaternion perturbation (includes rotation of the velocity vector to maintain constant Earth-fixed velocity)
         else:
@@ -2578,7 +2268,7 @@ class Scene:
             self._airplanes[aircraft_name].set_state(**pert_state)
             self._perform_geometry_and_atmos_calcs()
             self.solve_forces(nondimensional=False, **kwargs)
-            FM_fwd = copy.deepcopy(self._FM)
+            FM_fwd = self._FM[aircraft_name]["total"]
 
             # Backward perturbation
             q_bwd = quat_mult(q0, quat_conj(dq))
@@ -2588,17 +2278,11 @@ class Scene:
             self._airplanes[aircraft_name].set_state(**pert_state)
             self._perform_geometry_and_atmos_calcs()
             self.solve_forces(nondimensional=False, **kwargs)
-            FM_bwd = copy.deepcopy(self._FM)
+            FM_bwd = self._FM[aircraft_name]["total"]
 
         # Estimate derivative
-        derivs = {}
         diff = 0.5/perturbation
-        derivs["dFx,d{0}".format(tag)] = (FM_fwd[aircraft_name]["total"]["Fx"]-FM_bwd[aircraft_name]["total"]["Fx"])*diff
-        derivs["dFy,d{0}".format(tag)] = (FM_fwd[aircraft_name]["total"]["Fy"]-FM_bwd[aircraft_name]["total"]["Fy"])*diff
-        derivs["dFz,d{0}".format(tag)] = (FM_fwd[aircraft_name]["total"]["Fz"]-FM_bwd[aircraft_name]["total"]["Fz"])*diff
-        derivs["dMx,d{0}".format(tag)] = (FM_fwd[aircraft_name]["total"]["Mx"]-FM_bwd[aircraft_name]["total"]["Mx"])*diff
-        derivs["dMy,d{0}".format(tag)] = (FM_fwd[aircraft_name]["total"]["My"]-FM_bwd[aircraft_name]["total"]["My"])*diff
-        derivs["dMz,d{0}".format(tag)] = (FM_fwd[aircraft_name]["total"]["Mz"]-FM_bwd[aircraft_name]["total"]["Mz"])*diff
+        derivs = {"d{0},d{1}".format(key, tag) : (FM_fwd[key]-FM_bwd[key])*diff for key in _FM_KEYS["body"]}
 
         return derivs
 
@@ -3322,73 +3006,73 @@ class Scene:
                 dist[airplane_name][segment_name] = {}
 
                 # Control point locations
-                dist[airplane_name][segment_name]["span_frac"] = list(segment_object.cp_span_locs)
-                dist[airplane_name][segment_name]["cpx"] = list(self._PC[cur_slice,0])
-                dist[airplane_name][segment_name]["cpy"] = list(self._PC[cur_slice,1])
-                dist[airplane_name][segment_name]["cpz"] = list(self._PC[cur_slice,2])
+                dist[airplane_name][segment_name]["span_frac"] = segment_object.cp_span_locs.tolist()
+                dist[airplane_name][segment_name]["cpx"] = self._PC[cur_slice,0].tolist()
+                dist[airplane_name][segment_name]["cpy"] = self._PC[cur_slice,1].tolist()
+                dist[airplane_name][segment_name]["cpz"] = self._PC[cur_slice,2].tolist()
 
                 # Geometry
                 if self._use_swept_sections:
-                    dist[airplane_name][segment_name]["chord"] = list(self._c_bar[cur_slice]*self._C_sweep_inv[cur_slice])
-                    dist[airplane_name][segment_name]["swept_chord"] = list(self._c_bar[cur_slice])
+                    dist[airplane_name][segment_name]["chord"] = (self._c_bar[cur_slice]*self._C_sweep_inv[cur_slice]).tolist()
+                    dist[airplane_name][segment_name]["swept_chord"] = self._c_bar[cur_slice].tolist()
                 else:
-                    dist[airplane_name][segment_name]["chord"] = list(self._c_bar[cur_slice])
-                    dist[airplane_name][segment_name]["swept_chord"] = list(self._c_bar[cur_slice])
-                dist[airplane_name][segment_name]["area"] = list(self._dS[cur_slice])
+                    dist[airplane_name][segment_name]["chord"] = self._c_bar[cur_slice].tolist()
+                    dist[airplane_name][segment_name]["swept_chord"] = self._c_bar[cur_slice].tolist()
+                dist[airplane_name][segment_name]["area"] = self._dS[cur_slice].tolist()
                 if radians:
-                    dist[airplane_name][segment_name]["twist"] = list(segment_object.twist_cp)
-                    dist[airplane_name][segment_name]["dihedral"] = list(segment_object.dihedral_cp)
-                    dist[airplane_name][segment_name]["sweep"] = list(segment_object.sweep_cp)
-                    dist[airplane_name][segment_name]["aero_sweep"] = list(self._section_sweep[cur_slice])
+                    dist[airplane_name][segment_name]["twist"] = segment_object.twist_cp.tolist()
+                    dist[airplane_name][segment_name]["dihedral"] = segment_object.dihedral_cp.tolist()
+                    dist[airplane_name][segment_name]["sweep"] = segment_object.sweep_cp.tolist()
+                    dist[airplane_name][segment_name]["aero_sweep"] = self._section_sweep[cur_slice].tolist()
                 else:
-                    dist[airplane_name][segment_name]["twist"] = list(np.degrees(segment_object.twist_cp))
-                    dist[airplane_name][segment_name]["dihedral"] = list(np.degrees(segment_object.dihedral_cp))
-                    dist[airplane_name][segment_name]["sweep"] = list(np.degrees(segment_object.sweep_cp))
-                    dist[airplane_name][segment_name]["aero_sweep"] = list(np.degrees(self._section_sweep[cur_slice]))
+                    dist[airplane_name][segment_name]["twist"] = np.degrees(segment_object.twist_cp).tolist()
+                    dist[airplane_name][segment_name]["dihedral"] = np.degrees(segment_object.dihedral_cp).tolist()
+                    dist[airplane_name][segment_name]["sweep"] = np.degrees(segment_object.sweep_cp).tolist()
+                    dist[airplane_name][segment_name]["aero_sweep"] = np.degrees(self._section_sweep[cur_slice]).tolist()
 
                 # Airfoil info
                 if radians:
                     if self._use_swept_sections:
-                        dist[airplane_name][segment_name]["section_aL0"] = list(self._aL0[cur_slice]*self._C_sweep_inv[cur_slice])
+                        dist[airplane_name][segment_name]["section_aL0"] = (self._aL0[cur_slice]*self._C_sweep_inv[cur_slice]).tolist()
                     else:
-                        dist[airplane_name][segment_name]["section_aL0"] = list(self._aL0[cur_slice])
-                    dist[airplane_name][segment_name]["alpha"] = list(self._alpha[cur_slice])
-                    dist[airplane_name][segment_name]["delta_flap"] = list(segment_object._delta_flap)
+                        dist[airplane_name][segment_name]["section_aL0"] = self._aL0[cur_slice].tolist()
+                    dist[airplane_name][segment_name]["alpha"] = self._alpha[cur_slice].tolist()
+                    dist[airplane_name][segment_name]["delta_flap"] = segment_object._delta_flap.tolist()
 
                 else:
                     if self._use_swept_sections:
-                        dist[airplane_name][segment_name]["section_aL0"] = list(np.degrees(self._aL0[cur_slice]*self._C_sweep_inv[cur_slice]))
+                        dist[airplane_name][segment_name]["section_aL0"] = np.degrees(self._aL0[cur_slice]*self._C_sweep_inv[cur_slice]).tolist()
                     else:
-                        dist[airplane_name][segment_name]["section_aL0"] = list(np.degrees(self._aL0[cur_slice]))
-                    dist[airplane_name][segment_name]["alpha"] = list(np.degrees(self._alpha[cur_slice]))
-                    dist[airplane_name][segment_name]["delta_flap"] = list(np.degrees(segment_object._delta_flap))
+                        dist[airplane_name][segment_name]["section_aL0"] = np.degrees(self._aL0[cur_slice]).tolist()
+                    dist[airplane_name][segment_name]["alpha"] = np.degrees(self._alpha[cur_slice]).tolist()
+                    dist[airplane_name][segment_name]["delta_flap"] = np.degrees(segment_object._delta_flap).tolist()
 
                 # Section coefficients
-                dist[airplane_name][segment_name]["section_CL"] = list(self._CL[cur_slice])
-                dist[airplane_name][segment_name]["section_Cm"] = list(self._Cm[cur_slice])
-                dist[airplane_name][segment_name]["section_parasitic_CD"] = list(self._CD[cur_slice])
+                dist[airplane_name][segment_name]["section_CL"] = self._CL[cur_slice].tolist()
+                dist[airplane_name][segment_name]["section_Cm"] = self._Cm[cur_slice].tolist()
+                dist[airplane_name][segment_name]["section_parasitic_CD"] = self._CD[cur_slice].tolist()
 
                 # Section force and moment components
-                dist[airplane_name][segment_name]["Fx"] = list(dF_b[cur_slice,0])
-                dist[airplane_name][segment_name]["Fy"] = list(dF_b[cur_slice,1])
-                dist[airplane_name][segment_name]["Fz"] = list(dF_b[cur_slice,2])
-                dist[airplane_name][segment_name]["Mx"] = list(dM_b[cur_slice,0])
-                dist[airplane_name][segment_name]["My"] = list(dM_b[cur_slice,1])
-                dist[airplane_name][segment_name]["Mz"] = list(dM_b[cur_slice,2])
-                dist[airplane_name][segment_name]["circ"] = list(self._gamma[cur_slice])
-                dist[airplane_name][segment_name]["CD_i"] = list(CD_i[cur_slice])
+                dist[airplane_name][segment_name]["Fx"] = dF_b[cur_slice,0].tolist()
+                dist[airplane_name][segment_name]["Fy"] = dF_b[cur_slice,1].tolist()
+                dist[airplane_name][segment_name]["Fz"] = dF_b[cur_slice,2].tolist()
+                dist[airplane_name][segment_name]["Mx"] = dM_b[cur_slice,0].tolist()
+                dist[airplane_name][segment_name]["My"] = dM_b[cur_slice,1].tolist()
+                dist[airplane_name][segment_name]["Mz"] = dM_b[cur_slice,2].tolist()
+                dist[airplane_name][segment_name]["circ"] = self._gamma[cur_slice].tolist()
+                dist[airplane_name][segment_name]["CD_i"] = CD_i[cur_slice].tolist()
 
                 # Atmospheric properties
                 v = quat_trans(airplane_object.q, self._v_i[cur_slice,:])
-                dist[airplane_name][segment_name]["u"] = list(v[:,0])
-                dist[airplane_name][segment_name]["v"] = list(v[:,1])
-                dist[airplane_name][segment_name]["w"] = list(v[:,2])
-                dist[airplane_name][segment_name]["Re"] = list(self._Re[cur_slice])
-                dist[airplane_name][segment_name]["M"] = list(self._M[cur_slice])
+                dist[airplane_name][segment_name]["u"] = v[:,0].tolist()
+                dist[airplane_name][segment_name]["v"] = v[:,1].tolist()
+                dist[airplane_name][segment_name]["w"] = v[:,2].tolist()
+                dist[airplane_name][segment_name]["Re"] = self._Re[cur_slice].tolist()
+                dist[airplane_name][segment_name]["M"] = self._M[cur_slice].tolist()
                 if self._use_in_plane:
-                    dist[airplane_name][segment_name]["q"] = list(self._redim_in_plane[cur_slice]/self._dS[cur_slice])
+                    dist[airplane_name][segment_name]["q"] = (self._redim_in_plane[cur_slice]/self._dS[cur_slice]).tolist()
                 else:
-                    dist[airplane_name][segment_name]["q"] = list(self._redim_full[cur_slice]/self._dS[cur_slice])
+                    dist[airplane_name][segment_name]["q"] = (self._redim_full[cur_slice]/self._dS[cur_slice]).tolist()
 
                 # Save to data table
                 if filename is not None:
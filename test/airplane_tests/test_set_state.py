@@ -85,4 +85,23 @@ def test_get_alpha_and_beta():
 
     alpha, beta, velocity = scene._airplanes["test_plane"].get_aerodynamic_state(v_wind=v_wind)
     assert abs(alpha-5.0)<1e-10
-    assert abs(beta-5.0)<1e-10
\ No newline at end of file
+    assert abs(beta-5.0)<1e-10
+
+def test_outline_points_follow_state():
+    # Tests the stored Earth-fixed outlines are reused until the aircraft moves
+
+    # Load input
+    with open(input_file, 'r') as input_handle:
+        input_dict = json.load(input_handle)
+
+    scene = MX.Scene(input_dict)
+    airplane_object = scene._airplanes["test_plane"]
+
+    outlines = airplane_object.get_outline_points()
+    assert airplane_object.get_outline_points() is outlines
+
+    scene.set_aircraft_state(state={"position" : [10.0, 0.0, -5.0], "velocity" : 100})
+    moved_outlines = airplane_object.get_outline_points()
+    assert moved_outlines is not outlines
+    for segment_name, (points, _) in moved_outlines.items():
+        assert np.allclose(points, outlines[segment_name][0]+np.array([10.0, 0.0, -5.0]), rtol=0.0, atol=1e-10)
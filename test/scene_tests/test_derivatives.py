@@ -157,4 +157,15 @@ def test_all_derivs():
     assert abs(derivs["test_plane"]["damping"]["Cz,rbar"])<1e-9
     assert abs(derivs["test_plane"]["damping"]["Cl,rbar"]-0.3681357898633655)<1e-8
     assert abs(derivs["test_plane"]["damping"]["Cm,rbar"])<1e-9
-    assert abs(derivs["test_plane"]["damping"]["Cn,rbar"]+0.9272539506646101)<1e-8
\ No newline at end of file
+    assert abs(derivs["test_plane"]["damping"]["Cn,rbar"]+0.9272539506646101)<1e-8
+
+def test_all_derivs_for_named_aircraft():
+    # Tests the derivatives of an aircraft specified by name
+
+    # Load scene
+    scene = MX.Scene(input_file)
+    derivs = scene.derivatives(aircraft="test_plane")
+
+    assert abs(derivs["test_plane"]["stability"]["CL,a"]-6.322012906729068)<1e-10
+    assert abs(derivs["test_plane"]["damping"]["Cm,qbar"]+36.46247702820127)<1e-9
+    assert abs(derivs["test_plane"]["control"]["Cn,drudder"]-0.511515145687878)<1e-10
@@ -4,6 +4,7 @@ import machupX as MX
 import numpy as np
 import json
 import subprocess as sp
+import warnings
 
 input_file = "test/input_for_testing.json"
 
@@ -183,4 +184,83 @@ def test_atmos_wind_field_from_file():
 
     for position, correct_wind in zip(positions,winds):
         wind = scene._get_wind(position)
-        assert np.allclose(wind, correct_wind, rtol=0, atol=1e-10)
\ No newline at end of file
+        assert np.allclose(wind, correct_wind, rtol=0, atol=1e-10)
+
+def test_atmos_wind_field_on_grid():
+    # Alter input
+    with open(input_file, 'r') as json_handle:
+        input_dict = json.load(json_handle)
+
+    # Wind varying linearly over a rectilinear grid, given in shuffled order
+    wind_func = lambda p : np.array([10.0+0.01*p[0], 5.0-0.02*p[1], 0.03*p[2]])
+    wind_data = []
+    for x in [0.0, 500.0, 1000.0]:
+        for y in [0.0, 1000.0]:
+            for z in [-1000.0, 0.0]:
+                wind_data.append([x, y, z, *wind_func([x, y, z])])
+    wind_data = np.random.permutation(np.array(wind_data))
+
+    input_dict["units"] = "SI"
+    input_dict["scene"]["atmosphere"]["V_wind"] = wind_data.tolist()
+
+    scene = MX.Scene(input_dict)
+
+    positions = np.array([[250.0, 300.0, -100.0],
+                          [900.0, 10.0, -999.0],
+                          [0.0, 1000.0, 0.0]])
+
+    for position in positions:
+        wind = scene._get_wind(position)
+        assert np.allclose(wind, wind_func(position), rtol=0, atol=1e-10)
+
+    winds = scene._get_wind(positions)
+    assert np.allclose(winds, np.array([wind_func(position) for position in positions]), rtol=0, atol=1e-10)
+
+    # Outside the field
+    assert np.allclose(scene._get_wind(np.array([2000.0, 0.0, 0.0])), [0.0, 0.0, 0.0], rtol=0, atol=1e-10)
+
+
+def test_wind_array_atmos_profile_single_point():
+    # Alter input
+    with open(input_file, 'r') as json_handle:
+        input_dict = json.load(json_handle)
+
+    input_dict["units"] = "SI"
+    input_dict["scene"]["atmosphere"]["V_wind"] = [[0.0, 1.0, 2.0, 3.0]]
+
+    scene = MX.Scene(input_dict)
+
+    for alt in [-100.0, 0.0, 500.0]:
+        position = np.random.random(3)*10000
+        position[2] = -alt
+        wind = scene._get_wind(position)
+        assert np.allclose(wind, [1.0, 2.0, 3.0], rtol=0.0, atol=1e-10) == True
+
+
+def test_wind_array_atmos_profile_with_step():
+    # Alter input
+    with open(input_file, 'r') as json_handle:
+        input_dict = json.load(json_handle)
+
+    input_dict["units"] = "SI"
+    input_dict["scene"]["atmosphere"]["V_wind"] = [[0.0, 0.0, 0.0, 0.0],
+                                                [1000.0, 10.0, 0.0, 0.0],
+                                                [1000.0, 20.0, 0.0, 0.0],
+                                                [2000.0, 30.0, 0.0, 0.0]]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        scene = MX.Scene(input_dict)
+
+    alts = [500, 999, 1000, 1500, 3000]
+    winds = [[5,0,0],
+             [9.99,0,0],
+             [20,0,0],
+             [25,0,0],
+             [30,0,0]]
+
+    for alt, correct_wind in zip(alts, winds): 
+        position = np.random.random(3)*10000
+        position[2] = -alt
+        wind = scene._get_wind(position)
+        assert np.allclose(wind, correct_wind, rtol=0.0, atol=1e-10) == True
@@ -491,4 +491,25 @@ def test_swept_wing_with_aerodynamic_twist():
     assert abs(FM["test_plane"]["total"]["Fz"]-1.9383904914534897)<1e-10
     assert abs(FM["test_plane"]["total"]["Mx"])<1e-10
     assert abs(FM["test_plane"]["total"]["My"]-0.41401938251627074)<1e-10
-    assert abs(FM["test_plane"]["total"]["Mz"])<1e-10
\ No newline at end of file
+    assert abs(FM["test_plane"]["total"]["Mz"])<1e-10
+
+def test_single_precision_geometry():
+    # Tests the solution using single-precision geometry tables matches the double-precision solution
+
+    # Alter input
+    with open(input_file, 'r') as input_file_handle:
+        input_dict = json.load(input_file_handle)
+
+    input_dict["solver"]["type"] = "nonlinear"
+
+    # Create scenes
+    scene = MX.Scene(input_dict)
+    FM = scene.solve_forces(dimensional=False)
+
+    input_dict["solver"]["single_precision"] = True
+    scene = MX.Scene(input_dict)
+    FM_single = scene.solve_forces(dimensional=False)
+    assert scene._r_0.dtype == np.float32
+
+    for key in ["CL", "CD", "Cm"]:
+        assert abs(FM_single["test_plane"]["total"][key]-FM["test_plane"]["total"][key])<1e-6